@@ -97,6 +97,7 @@ class BoostConan(ConanFile):
         "lzma": [True, False],
         "zstd": [True, False],
         "segmented_stacks": [True, False],
+        "context_impl": [None, "fcontext", "ucontext", "winfib"],  # Boost.Context backend; upstream default, if None
         "debug_level": list(range(0, 14)),
         "pch": [True, False],
         "extra_b2_flags": [None, "ANY"],  # custom b2 flags
@@ -136,6 +137,7 @@ class BoostConan(ConanFile):
         "lzma": False,
         "zstd": False,
         "segmented_stacks": False,
+        "context_impl": None,
         "debug_level": 0,
         "pch": True,
         "extra_b2_flags": None,
@@ -671,6 +673,9 @@ class BoostConan(ConanFile):
         if self.options.without_fiber:
             self.options.rm_safe("numa")
 
+        if self.options.header_only or self.options.get_safe("without_context", True):
+            self.options.rm_safe("context_impl")
+
         # Use verbosity from [conf] if specified
         verbosity = self.conf.get("tools.build:verbosity", default="quiet")
         if verbosity == "verbose" and int(self.options.debug_level) < 2:
@@ -775,6 +780,16 @@ class BoostConan(ConanFile):
             raise ConanInvalidConfiguration("Boost.Cobalt requires a C++20 capable compiler. "
                                             "Please, set compiler.cppstd and use a newer compiler version, or disable from building.")
 
+        context_impl = self.options.get_safe("context_impl")
+        if context_impl == "winfib" and not self._is_windows_platform:
+            raise ConanInvalidConfiguration("Boost.Context 'winfib' implementation is only available on Windows.")
+        if context_impl == "ucontext" and self._is_windows_platform:
+            raise ConanInvalidConfiguration("Boost.Context 'ucontext' implementation is not available on Windows.")
+        if context_impl == "fcontext" and (not self._b2_architecture or not self._b2_abi or not self._b2_binary_format):
+            raise ConanInvalidConfiguration(f"Boost.Context 'fcontext' implementation has no assembly for {self.settings.os}/{self.settings.arch}.")
+        if context_impl in ("fcontext", "winfib") and self.options.segmented_stacks:
+            raise ConanInvalidConfiguration("Boost segmented_stacks requires the 'ucontext' Boost.Context implementation.")
+
         # TODO: Revisit on Boost 1.87.0. Remove in case Process is fixed.
         if Version(self.version) == "1.86.0" and is_msvc(self) and self.options.get_safe("shared") and self.options.get_safe("without_process", None) == False:
             raise ConanInvalidConfiguration(f"{self.ref} Boost.Process will fail to be consumed as shared library on MSVC. See https://github.com/boostorg/process/issues/408.")
@@ -1394,6 +1409,14 @@ class BoostConan(ConanFile):
             flags.extend(["segmented-stacks=on",
                           "define=BOOST_USE_SEGMENTED_STACKS=1",
                           "define=BOOST_USE_UCONTEXT=1"])
+        context_impl = self.options.get_safe("context_impl")
+        if context_impl:
+            # https://www.boost.org/doc/libs/release/libs/context/doc/html/context/cc/implementations__fcontext_t__ucontext_t_and_winfiber.html
+            flags.append(f"context-impl={context_impl}")
+            if context_impl == "ucontext" and not self.options.segmented_stacks:
+                flags.append("define=BOOST_USE_UCONTEXT=1")
+            elif context_impl == "winfib":
+                flags.append("define=BOOST_USE_WINFIB=1")
         flags.append("pch=on" if self.options.pch else "pch=off")
 
         if is_apple_os(self):
@@ -1788,6 +1811,14 @@ class BoostConan(ConanFile):
         if self.options.segmented_stacks:
             self.cpp_info.components["headers"].defines.extend(["BOOST_USE_SEGMENTED_STACKS", "BOOST_USE_UCONTEXT"])
 
+        # Headers of Boost.Context, Coroutine and Fiber select the context API from these defines,
+        # so consumers must see the same implementation the libraries were built with
+        context_impl = self.options.get_safe("context_impl")
+        if context_impl == "ucontext" and not self.options.segmented_stacks:
+            self.cpp_info.components["headers"].defines.append("BOOST_USE_UCONTEXT")
+        elif context_impl == "winfib":
+            self.cpp_info.components["headers"].defines.append("BOOST_USE_WINFIB")
+
         if self.options.system_use_utf8:
             self.cpp_info.components["headers"].defines.append("BOOST_SYSTEM_USE_UTF8")
 
@@ -20,11 +20,13 @@ class Box2dConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
     options = {
         "shared": [True, False],
-        "fPIC": [True, False]
+        "fPIC": [True, False],
+        "simd": ["sse2", "avx2", "neon", "disabled"],
     }
     default_options = {
         "shared": False,
-        "fPIC": True
+        "fPIC": True,
+        "simd": "sse2",
     }
 
     @property
@@ -37,9 +39,23 @@ class Box2dConan(ConanFile):
             "Visual Studio": "17",
         }
 
+    @property
+    def _is_x86(self):
+        return str(self.settings.arch) in ["x86", "x86_64"]
+
+    @property
+    def _is_arm64(self):
+        return str(self.settings.arch).startswith("armv8") or self.settings.arch == "arm64ec"
+
     def config_options(self):
         if self.settings.os == "Windows":
             self.options.rm_safe("fPIC")
+        if Version(self.version) < "3.0.0":
+            del self.options.simd
+        elif self._is_arm64:
+            self.options.simd = "neon"
+        elif not self._is_x86:
+            self.options.simd = "disabled"
 
     def configure(self):
         if self.options.shared:
@@ -59,6 +75,11 @@ class Box2dConan(ConanFile):
         if Version(self.version) < "3.0.0":
             return
 
+        if self.options.simd in ["sse2", "avx2"] and not self._is_x86:
+            raise ConanInvalidConfiguration(f"{self.ref} simd={self.options.simd} requires an x86 architecture")
+        if self.options.simd == "neon" and not self._is_arm64:
+            raise ConanInvalidConfiguration(f"{self.ref} simd=neon requires an armv8 architecture")
+
         minimum_version = self._compilers_minimum_version.get(str(self.settings.compiler), False)
         if minimum_version and Version(self.settings.compiler.version) < minimum_version:
             raise ConanInvalidConfiguration(
@@ -83,6 +104,9 @@ class Box2dConan(ConanFile):
             tc.variables["BOX2D_SAMPLES"] = False
             tc.variables["BOX2D_VALIDATE"] = False
             tc.variables["BOX2D_UNIT_TESTS"] = False
+            # SSE2 and NEON are selected by the architecture, AVX2 must be requested explicitly
+            tc.variables["BOX2D_DISABLE_SIMD"] = self.options.simd == "disabled"
+            tc.variables["BOX2D_AVX2"] = self.options.simd == "avx2"
         tc.generate()
         if Version(self.version) >= "3.0.0":
             deps = CMakeDeps(self)
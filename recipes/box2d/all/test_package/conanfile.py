@@ -12,8 +12,14 @@ class Box2DTestConan(ConanFile):
     def layout(self):
         cmake_layout(self)
 
+    @property
+    def _tested_version(self):
+        return Version(self.tested_reference_str.split("/")[1].split("@")[0])
+
     def requirements(self):
         self.requires(self.tested_reference_str)
+        if self._tested_version >= "3.0.0":
+            self.requires("enkits/1.11")
 
     def build_requirements(self):
         self.tool_requires("cmake/[>=3.21 <4]")
@@ -27,3 +33,6 @@ class Box2DTestConan(ConanFile):
         if can_run(self):
             bin_path = os.path.join(self.cpp.build.bindirs[0], "test_package")
             self.run(bin_path, env="conanrun")
+            if self._tested_version >= "3.0.0":
+                bin_path = os.path.join(self.cpp.build.bindirs[0], "test_task_system")
+                self.run(bin_path, env="conanrun")
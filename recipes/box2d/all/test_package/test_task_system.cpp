@@ -0,0 +1,103 @@
+// Steps a box2d world with its solver tasks dispatched to an enkiTS thread pool
+#include "box2d/box2d.h"
+
+#include <enkiTS/TaskScheduler.h>
+
+#include <cstdio>
+#include <cstdlib>
+
+namespace {
+
+constexpr int max_tasks = 128;
+
+class SolverTask : public enki::ITaskSet {
+public:
+    void ExecuteRange(enki::TaskSetPartition range, uint32_t threadnum) override {
+        task(range.start, range.end, threadnum, taskContext);
+    }
+
+    b2TaskCallback* task = nullptr;
+    void* taskContext = nullptr;
+};
+
+struct TaskSystem {
+    enki::TaskScheduler scheduler;
+    SolverTask tasks[max_tasks];
+    int taskCount = 0;
+    int enqueuedTotal = 0;
+};
+
+void* EnqueueTask(b2TaskCallback* task, int32_t itemCount, int32_t minRange, void* taskContext, void* userContext) {
+    TaskSystem* system = static_cast<TaskSystem*>(userContext);
+    if (system->taskCount == max_tasks) {
+        // run inline, box2d accepts a null handle for completed work
+        task(0, itemCount, 0, taskContext);
+        return nullptr;
+    }
+    SolverTask& solverTask = system->tasks[system->taskCount++];
+    solverTask.m_SetSize = itemCount;
+    solverTask.m_MinRange = minRange;
+    solverTask.task = task;
+    solverTask.taskContext = taskContext;
+    system->scheduler.AddTaskSetToPipe(&solverTask);
+    ++system->enqueuedTotal;
+    return &solverTask;
+}
+
+void FinishTask(void* userTask, void* userContext) {
+    if (userTask != nullptr) {
+        TaskSystem* system = static_cast<TaskSystem*>(userContext);
+        system->scheduler.WaitforTask(static_cast<SolverTask*>(userTask));
+    }
+}
+
+}
+
+int main() {
+    TaskSystem system;
+    system.scheduler.Initialize(4);
+
+    b2WorldDef worldDef = b2DefaultWorldDef();
+    worldDef.gravity = b2Vec2{0.0f, -10.0f};
+    worldDef.workerCount = static_cast<int>(system.scheduler.GetNumTaskThreads());
+    worldDef.enqueueTask = EnqueueTask;
+    worldDef.finishTask = FinishTask;
+    worldDef.userTaskContext = &system;
+    b2WorldId worldId = b2CreateWorld(&worldDef);
+
+    b2BodyDef groundDef = b2DefaultBodyDef();
+    b2BodyId groundId = b2CreateBody(worldId, &groundDef);
+    b2Segment ground = {b2Vec2{-100.0f, 0.0f}, b2Vec2{100.0f, 0.0f}};
+    b2ShapeDef groundShapeDef = b2DefaultShapeDef();
+    b2CreateSegmentShape(groundId, &groundShapeDef, &ground);
+
+    // enough bodies and contacts for the solver to split its work across workers
+    b2Polygon box = b2MakeBox(0.5f, 0.5f);
+    b2ShapeDef boxShapeDef = b2DefaultShapeDef();
+    b2BodyId topBody = b2_nullBodyId;
+    for (int column = 0; column < 20; ++column) {
+        for (int row = 0; row < 20; ++row) {
+            b2BodyDef bodyDef = b2DefaultBodyDef();
+            bodyDef.type = b2_dynamicBody;
+            bodyDef.position = b2Vec2{-20.0f + 2.0f * column, 0.5f + 1.1f * row};
+            topBody = b2CreateBody(worldId, &bodyDef);
+            b2CreatePolygonShape(topBody, &boxShapeDef, &box);
+        }
+    }
+
+    const float startHeight = b2Body_GetPosition(topBody).y;
+    for (int step = 0; step < 60; ++step) {
+        b2World_Step(worldId, 1.0f / 60.0f, 4);
+        system.taskCount = 0;
+    }
+    const float endHeight = b2Body_GetPosition(topBody).y;
+    b2DestroyWorld(worldId);
+
+    std::printf("workers: %u, tasks enqueued: %d, top box height: %.2f -> %.2f\n",
+                system.scheduler.GetNumTaskThreads(), system.enqueuedTotal, startHeight, endHeight);
+    if (system.enqueuedTotal == 0 || !(endHeight < startHeight)) {
+        std::fprintf(stderr, "box2d did not step the world through the task system\n");
+        return EXIT_FAILURE;
+    }
+    return EXIT_SUCCESS;
+}
@@ -39,6 +39,9 @@ class CPythonConan(ConanFile):
         "with_tkinter": [True, False],
         "with_curses": [True, False],
         "with_lzma": [True, False],
+        "freethreaded": [True, False],
+        "experimental_jit": ["no", "yes", "yes-off", "interpreter"],
+        "with_mimalloc": [True, False],
 
         # options that don't change package id
         "env_vars": [True, False],  # set environment variables
@@ -57,6 +60,9 @@ class CPythonConan(ConanFile):
         "with_tkinter": True,
         "with_curses": True,
         "with_lzma": True,
+        "freethreaded": False,
+        "experimental_jit": "no",
+        "with_mimalloc": True,
 
         # options that don't change package id
         "env_vars": True,
@@ -73,6 +79,10 @@ class CPythonConan(ConanFile):
         joiner = "" if is_msvc(self) else "."
         return f"{v.major}{joiner}{v.minor}"
 
+    @property
+    def _freethreaded(self):
+        return bool(self.options.get_safe("freethreaded", False))
+
     def export_sources(self):
         export_conandata_patches(self)
 
@@ -86,6 +96,11 @@ class CPythonConan(ConanFile):
             del self.options.with_curses
             del self.options.with_gdbm
             del self.options.with_nis
+        if Version(self.version) < "3.13":
+            # The free-threaded build, the copy-and-patch JIT and the bundled mimalloc were introduced in 3.13
+            del self.options.freethreaded
+            del self.options.experimental_jit
+            del self.options.with_mimalloc
 
         self.settings.compiler.rm_safe("libcxx")
         self.settings.compiler.rm_safe("cppstd")
@@ -183,6 +198,19 @@ class CPythonConan(ConanFile):
                 if self.dependencies["mpdecimal"].ref.version < Version("2.5.0"):
                     raise ConanInvalidConfiguration("cpython 3.9.0 (and newer) requires (at least) mpdecimal 2.5.0")
 
+        if is_msvc(self) and Version(self.version) >= "3.13":
+            # FIXME: the MSVC project patching of this recipe has not been ported to 3.13 (yet)
+            raise ConanInvalidConfiguration(f"{self.ref} does not support MSVC builds (yet)")
+        if self._freethreaded and not self.options.with_mimalloc:
+            # Py_GIL_DISABLED builds rely on mimalloc for thread-safe allocations of Python objects
+            raise ConanInvalidConfiguration(f"{self.ref} requires -o {self.ref.name}/*:with_mimalloc=True when freethreaded=True")
+        if self._freethreaded and self.options.experimental_jit != "no":
+            raise ConanInvalidConfiguration("The experimental JIT of cpython is not compatible with the free-threaded build")
+        if self.options.get_safe("experimental_jit") in ["yes", "yes-off"]:
+            # The JIT stencils are generated at build time with LLVM 18 (clang, llvm-readobj, llvm-objdump),
+            # which is not available as a Conan tool requirement. The tier 2 interpreter does not need it.
+            raise ConanInvalidConfiguration(f"{self.ref} only supports experimental_jit=no or experimental_jit=interpreter (LLVM 18 is not packaged)")
+
         if self.settings.compiler == "gcc" and Version(self.settings.compiler.version).major == 9 and Version(self.version) >= "3.12":
             raise ConanInvalidConfiguration("FIXME: GCC 9 produces an internal compiler error locally, and a link error in CCI")
 
@@ -208,6 +236,13 @@ class CPythonConan(ConanFile):
             tc.configure_args.append("--with-system-ffi")
         if Version(self.version) >= "3.10":
             tc.configure_args.append("--disable-test-modules")
+        if Version(self.version) >= "3.13":
+            tc.configure_args += [
+                "--with-mimalloc={}".format(yes_no(self.options.with_mimalloc)),
+                "--enable-experimental-jit={}".format(self.options.experimental_jit),
+            ]
+            if self.options.freethreaded:
+                tc.configure_args.append("--disable-gil")
         if self.options.get_safe("with_sqlite3"):
             tc.configure_args.append("--enable-loadable-sqlite-extensions={}".format(
                 yes_no(not self.dependencies["sqlite3"].options.omit_load_extension)
@@ -752,13 +787,13 @@ class CPythonConan(ConanFile):
                         while [ -L "$__file__" ]; do
                             __file__="$(dirname "$__file__")/$(readlink "$__file__")"
                         done
-                        exec "$(dirname "$__file__")/python{self._version_suffix}" "$0" "$@"
+                        exec "$(dirname "$__file__")/{self._cpython_interpreter_name}" "$0" "$@"
                         '''
                         """).encode())
                     fn.write(text)
 
             if not os.path.exists(self._cpython_symlink):
-                os.symlink(f"python{self._version_suffix}", self._cpython_symlink)
+                os.symlink(self._cpython_interpreter_name, self._cpython_symlink)
         fix_apple_shared_install_name(self)
 
         self._write_cmake_findpython_wrapper_file()
@@ -778,6 +813,8 @@ class CPythonConan(ConanFile):
                 python += "_d"
         else:
             python += self._version_suffix
+            if self._freethreaded:
+                python += "t"
         if self.settings.os == "Windows":
             python += ".exe"
         return python
@@ -789,6 +826,8 @@ class CPythonConan(ConanFile):
     @property
     def _abi_suffix(self):
         res = ""
+        if self._freethreaded:
+            res += "t"
         if self.settings.build_type == "Debug":
             res += "d"
         return res
@@ -806,6 +845,8 @@ class CPythonConan(ConanFile):
 
     def package_info(self):
         py_version = Version(self.version)
+        # Free-threaded builds install python-3.13t.pc, python-3.13t-embed.pc, ...
+        pc_suffix = "t" if self._freethreaded else ""
         # python component: "Build a C extension for Python"
         if is_msvc(self):
             self.cpp_info.components["python"].includedirs = [os.path.join(self._msvc_install_subprefix, "include")]
@@ -829,10 +870,10 @@ class CPythonConan(ConanFile):
         if self.settings.os != "Windows":
             self.cpp_info.components["python"].requires.append("libxcrypt::libxcrypt")
         self.cpp_info.components["python"].set_property(
-            "pkg_config_name", f"python-{py_version.major}.{py_version.minor}"
+            "pkg_config_name", f"python-{py_version.major}.{py_version.minor}{pc_suffix}"
         )
         self.cpp_info.components["python"].set_property(
-            "pkg_config_aliases", [f"python{py_version.major}"]
+            "pkg_config_aliases", [f"python{py_version.major}{pc_suffix}"]
         )
         self.cpp_info.components["python"].libdirs = []
 
@@ -841,10 +882,10 @@ class CPythonConan(ConanFile):
         self.cpp_info.components["embed"].libdirs = [libdir]
         self.cpp_info.components["embed"].includedirs = []
         self.cpp_info.components["embed"].set_property(
-            "pkg_config_name", f"python-{py_version.major}.{py_version.minor}-embed"
+            "pkg_config_name", f"python-{py_version.major}.{py_version.minor}{pc_suffix}-embed"
         )
         self.cpp_info.components["embed"].set_property(
-            "pkg_config_aliases", [f"python{py_version.major}-embed"]
+            "pkg_config_aliases", [f"python{py_version.major}{pc_suffix}-embed"]
         )
         self.cpp_info.components["embed"].requires = ["python"]
 
@@ -150,6 +150,7 @@ class TestPackageConan(ConanFile):
                 self._test_module("sqlite3", self._cpython_option("with_sqlite3"))
                 self._test_module("decimal", True)
                 self._test_module("ctypes", True)
+                self._test_module("freethreading", self._cpython_option("freethreaded"))
                 env = Environment()
                 if self.settings.os != "Windows":
                     env.define_path("OPENSSL_CONF", os.path.join(os.sep, "dev", "null"))
@@ -189,6 +189,38 @@ def test_ssl():
     print("default_context.options={}".format(default_context.options))
 
 
+@add_test
+def test_freethreading():
+    import sysconfig
+    import threading
+    import time
+
+    if not sysconfig.get_config_var("Py_GIL_DISABLED"):
+        raise Exception("Python was not built with Py_GIL_DISABLED")
+
+    def work(n):
+        total = 0
+        for i in range(n):
+            total += i * i
+        return total
+
+    nb_threads = 4
+    iterations = 2_000_000
+    threads = [threading.Thread(target=work, args=(iterations,)) for _ in range(nb_threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    print("{} CPU-bound threads finished in {:.3f}s".format(nb_threads, elapsed))
+
+    # Importing an extension module that does not declare Py_mod_gil re-enables the GIL at runtime,
+    # so check the state after the threads have run.
+    if sys._is_gil_enabled():
+        raise Exception("The GIL is enabled")
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("-b", dest="build_folder", help="build_folder", required=True)
@@ -21,9 +21,11 @@ class EigenConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
     options = {
         "MPL2_only": [True, False],
+        "blas": ["none", "openblas"],
     }
     default_options = {
         "MPL2_only": False,
+        "blas": "none",
     }
 
     def export_sources(self):
@@ -40,6 +42,11 @@ class EigenConan(ConanFile):
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    def requirements(self):
+        if self.options.blas == "openblas":
+            # Eigen declares the BLAS/LAPACKE prototypes itself, only the libraries are needed
+            self.requires("openblas/[^0.3.27]", transitive_libs=True)
+
     def package_id(self):
         self.info.clear()
 
@@ -89,6 +96,11 @@ class EigenConan(ConanFile):
             self.cpp_info.components["eigen3"].system_libs = ["m"]
         if self.options.get_safe("MPL2_only"):
             self.cpp_info.components["eigen3"].defines = ["EIGEN_MPL2_ONLY"]
+        if self.options.blas == "openblas":
+            self.cpp_info.components["eigen3"].requires = ["openblas::openblas"]
+            self.cpp_info.components["eigen3"].defines.append("EIGEN_USE_BLAS")
+            if self.dependencies["openblas"].options.build_lapack:
+                self.cpp_info.components["eigen3"].defines.append("EIGEN_USE_LAPACKE")
 
         self.cpp_info.components["eigen3"].set_property("cmake_target_name", "Eigen3::Eigen")
         self.cpp_info.components["eigen3"].includedirs = [os.path.join("include", "eigen3")]
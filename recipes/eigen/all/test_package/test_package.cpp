@@ -2,6 +2,10 @@
 #include <Eigen/Core>
 #include <unsupported/Eigen/MatrixFunctions>
 
+#if defined(TEST_EIGEN_BLAS) && !defined(EIGEN_USE_BLAS)
+#error "EIGEN_USE_BLAS is expected to be defined when Eigen uses an external BLAS"
+#endif
+
 
 int main(void)
 {
@@ -12,5 +16,19 @@ int main(void)
     std::cout << "A =\n" << A << "\n\n"
               << "A(2..3,:) =\n" << A.middleRows(2, 2) << "\n";
 
+    // Large enough to be dispatched to the GEMM kernel (and to BLAS when EIGEN_USE_BLAS is defined)
+    int const M = 256;
+    Eigen::MatrixXd B = Eigen::MatrixXd::Random(M, M);
+    Eigen::MatrixXd C = Eigen::MatrixXd::Random(M, M);
+    Eigen::MatrixXd product = B * C;
+    Eigen::MatrixXd reference = B.lazyProduct(C);
+    if (!product.isApprox(reference)) {
+        std::cerr << "Matrix product mismatch\n";
+        return 1;
+    }
+#ifdef EIGEN_USE_BLAS
+    std::cout << "Matrix product computed through BLAS\n";
+#endif
+
     return 0;
 }
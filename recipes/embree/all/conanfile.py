@@ -21,12 +21,54 @@ class EmbreeConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
     options = {
         "shared": [True, False],
-        "fPIC": [True, False]
+        "fPIC": [True, False],
+        "sse2": [True, False],
+        "sse42": [True, False],
+        "avx": [True, False],
+        "avx2": [True, False],
+        "avx512": [True, False],
+        "neon": [True, False],
+        "neon2x": [True, False],
+        "geometry_curve": [True, False],
+        "geometry_grid": [True, False],
+        "geometry_instance": [True, False],
+        "geometry_instance_array": [True, False],
+        "geometry_point": [True, False],
+        "geometry_quad": [True, False],
+        "geometry_subdivision": [True, False],
+        "geometry_triangle": [True, False],
+        "geometry_user": [True, False],
+        "ray_packets": [True, False],
+        "ray_masking": [True, False],
+        "backface_culling": [True, False],
+        "ignore_invalid_rays": [True, False],
+        "with_tbb": [True, False],
     }
 
     default_options = {
         "shared": False,
-        "fPIC": True
+        "fPIC": True,
+        "sse2": True,
+        "sse42": True,
+        "avx": True,
+        "avx2": True,
+        "avx512": True,
+        "neon": True,
+        "neon2x": True,
+        "geometry_curve": True,
+        "geometry_grid": True,
+        "geometry_instance": True,
+        "geometry_instance_array": True,
+        "geometry_point": True,
+        "geometry_quad": True,
+        "geometry_subdivision": True,
+        "geometry_triangle": True,
+        "geometry_user": True,
+        "ray_packets": True,
+        "ray_masking": True,
+        "backface_culling": False,
+        "ignore_invalid_rays": False,
+        "with_tbb": True,
     }
     implements = ["auto_shared_fpic"]
 
@@ -38,11 +80,36 @@ class EmbreeConan(ConanFile):
     def _has_neon(self):
         return "arm" in self.settings.arch
 
+    @property
+    def _num_isa(self):
+        return sum(1 for simd_option in ["sse2", "sse42", "avx", "avx2", "avx512", "neon", "neon2x"]
+                   if self.options.get_safe(simd_option))
+
+    def config_options(self):
+        if self.settings.os == "Windows":
+            del self.options.fPIC
+        if not self._has_sse_avx:
+            del self.options.sse2
+            del self.options.sse42
+            del self.options.avx
+            del self.options.avx2
+            del self.options.avx512
+        elif is_msvc(self):
+            self.options.avx512 = False
+        if not self._has_neon:
+            del self.options.neon
+            del self.options.neon2x
+        # For Emscripten disable TBB and all ISAs. It will compile only for SSE
+        if self.settings.os == "Emscripten":
+            del self.options.with_tbb
+        elif is_apple_os(self):
+            self.options.with_tbb = False
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
     def requirements(self):
-        if self.settings.os != "Emscripten":
+        if self.options.get_safe("with_tbb"):
             self.requires("onetbb/2021.12.0")
 
     def validate(self):
@@ -52,8 +119,12 @@ class EmbreeConan(ConanFile):
             self.settings.compiler == "apple-clang"
             and not self.options.shared
             and Version(self.settings.compiler.version) >= "9.0"
+            and self._num_isa > 1
         ):
             raise ConanInvalidConfiguration(f"{self.ref} static with apple-clang >=9 and multiple ISA (simd) is not supported")
+        # For Emscripten all ISAs are disabled and it compiles only for SSE
+        if self.settings.os != "Emscripten" and self._num_isa == 0:
+            raise ConanInvalidConfiguration("At least one ISA (simd) must be enabled")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -64,20 +135,29 @@ class EmbreeConan(ConanFile):
         tc.variables["BUILD_TESTING"] = False
         tc.variables["EMBREE_INSTALL_DEPENDENCIES"] = False
         tc.variables["EMBREE_TUTORIALS"] = False
-        tc.variables["EMBREE_BACKFACE_CULLING"] = False
-        tc.variables["EMBREE_IGNORE_INVALID_RAYS"] = False
+        tc.variables["EMBREE_GEOMETRY_CURVE"] = self.options.geometry_curve
+        tc.variables["EMBREE_GEOMETRY_GRID"] = self.options.geometry_grid
+        tc.variables["EMBREE_GEOMETRY_INSTANCE"] = self.options.geometry_instance
+        tc.variables["EMBREE_GEOMETRY_INSTANCE_ARRAY"] = self.options.geometry_instance_array
+        tc.variables["EMBREE_GEOMETRY_POINT"] = self.options.geometry_point
+        tc.variables["EMBREE_GEOMETRY_QUAD"] = self.options.geometry_quad
+        tc.variables["EMBREE_GEOMETRY_SUBDIVISION"] = self.options.geometry_subdivision
+        tc.variables["EMBREE_GEOMETRY_TRIANGLE"] = self.options.geometry_triangle
+        tc.variables["EMBREE_GEOMETRY_USER"] = self.options.geometry_user
+        tc.variables["EMBREE_RAY_PACKETS"] = self.options.ray_packets
+        tc.variables["EMBREE_RAY_MASK"] = self.options.ray_masking
+        tc.variables["EMBREE_BACKFACE_CULLING"] = self.options.backface_culling
+        tc.variables["EMBREE_IGNORE_INVALID_RAYS"] = self.options.ignore_invalid_rays
         tc.variables["EMBREE_ISPC_SUPPORT"] = False
-        tc.variables["EMBREE_TASKING_SYSTEM"] = "INTERNAL" if is_apple_os(self) or self.settings.os == "Emscripten" else "TBB"
+        tc.variables["EMBREE_TASKING_SYSTEM"] = "TBB" if self.options.get_safe("with_tbb") else "INTERNAL"
         tc.variables["EMBREE_MAX_ISA"] = "NONE"
-        tc.variables["EMBREE_ISA_NEON"] = self._has_neon
-        tc.variables["EMBREE_ISA_NEON2X"] = self._has_neon
-        tc.variables["EMBREE_ISA_SSE2"] = self._has_sse_avx
-        tc.variables["EMBREE_ISA_SSE42"] = self._has_sse_avx
-        # For Emscripten disable TBB and all ISAs. It will compile only for SSE
-        if self.settings.os == "Emscripten":
-            tc.variables["EMBREE_ISA_AVX"] = self._has_sse_avx
-            tc.variables["EMBREE_ISA_AVX2"] = self._has_sse_avx
-            tc.variables["EMBREE_ISA_AVX512"] = self._has_sse_avx and not is_msvc(self)
+        tc.variables["EMBREE_ISA_NEON"] = self.options.get_safe("neon", False)
+        tc.variables["EMBREE_ISA_NEON2X"] = self.options.get_safe("neon2x", False)
+        tc.variables["EMBREE_ISA_SSE2"] = self.options.get_safe("sse2", False)
+        tc.variables["EMBREE_ISA_SSE42"] = self.options.get_safe("sse42", False)
+        tc.variables["EMBREE_ISA_AVX"] = self.options.get_safe("avx", False)
+        tc.variables["EMBREE_ISA_AVX2"] = self.options.get_safe("avx2", False)
+        tc.variables["EMBREE_ISA_AVX512"] = self.options.get_safe("avx512", False)
         if is_msvc(self):
             tc.variables["USE_STATIC_RUNTIME"] = is_msvc_static_runtime(self)
         tc.generate()
@@ -115,12 +195,15 @@ class EmbreeConan(ConanFile):
         self.cpp_info.libs = ["embree4"]
         if not self.options.shared:
             self.cpp_info.libs.extend(["sys", "math", "simd", "lexers", "tasking"])
-            if self._has_sse_avx:
-                self.cpp_info.libs.extend(["embree_sse42", "embree_avx", "embree_avx2"])
-                if not is_msvc(self):
-                    self.cpp_info.libs.append("embree_avx512")
-            if self._has_neon:
-                self.cpp_info.libs.extend(["embree_avx2"])
+            if self.options.get_safe("sse42"):
+                self.cpp_info.libs.append("embree_sse42")
+            if self.options.get_safe("avx"):
+                self.cpp_info.libs.append("embree_avx")
+            # NEON2X kernels are built as the AVX2 library
+            if self.options.get_safe("avx2") or self.options.get_safe("neon2x"):
+                self.cpp_info.libs.append("embree_avx2")
+            if self.options.get_safe("avx512"):
+                self.cpp_info.libs.append("embree_avx512")
 
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.system_libs.extend(["dl", "m", "pthread"])
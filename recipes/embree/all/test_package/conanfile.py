@@ -22,5 +22,15 @@ class TestPackageConan(ConanFile):
 
     def test(self):
         if can_run(self):
+            embree_options = self.dependencies[self.tested_reference_str].options
+            properties = {
+                "ray_packets": embree_options.ray_packets,
+                "ray_masking": embree_options.ray_masking,
+                "backface_culling": embree_options.backface_culling,
+                "ignore_invalid_rays": embree_options.ignore_invalid_rays,
+                # 0 = internal tasking system, 1 = TBB
+                "tasking_system": embree_options.get_safe("with_tbb", False),
+            }
+            args = [f"{name}={int(bool(value))}" for name, value in properties.items()]
             bin_path = os.path.join(self.cpp.build.bindirs[0], "test_package")
-            self.run(bin_path, env="conanrun")
+            self.run(" ".join([bin_path] + args), env="conanrun")
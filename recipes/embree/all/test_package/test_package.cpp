@@ -1,16 +1,55 @@
 #include <embree4/rtcore.h>
 
+#include <cstdlib>
+#include <cstring>
 #include <iostream>
 #include <limits>
+#include <string>
 
-int main() {
+// Each argument is a "<property>=<value>" pair that the device must report
+int main(int argc, char **argv) {
   RTCDevice device = rtcNewDevice(NULL);
   RTCScene scene = rtcNewScene(device);
   RTCGeometry geom = rtcNewGeometry(device, RTC_GEOMETRY_TYPE_TRIANGLE);
 
+  const struct {
+    const char *name;
+    RTCDeviceProperty property;
+  } properties[] = {
+    {"ray_packets", RTC_DEVICE_PROPERTY_NATIVE_RAY4_SUPPORTED},
+    {"ray_masking", RTC_DEVICE_PROPERTY_RAY_MASK_SUPPORTED},
+    {"backface_culling", RTC_DEVICE_PROPERTY_BACKFACE_CULLING_ENABLED},
+    {"ignore_invalid_rays", RTC_DEVICE_PROPERTY_IGNORE_INVALID_RAYS_ENABLED},
+    {"tasking_system", RTC_DEVICE_PROPERTY_TASKING_SYSTEM},
+  };
+
+  int ret = EXIT_SUCCESS;
+  for (int i = 1; i < argc; i++) {
+    const std::string arg = argv[i];
+    const std::string::size_type sep = arg.find('=');
+    bool known = false;
+    for (const auto &property : properties) {
+      if (arg.compare(0, sep, property.name) != 0 || std::strlen(property.name) != sep) {
+        continue;
+      }
+      known = true;
+      const ssize_t expected = std::stol(arg.substr(sep + 1));
+      const ssize_t actual = rtcGetDeviceProperty(device, property.property);
+      std::cout << property.name << ": " << actual << std::endl;
+      if (actual != expected) {
+        std::cerr << property.name << " is " << actual << ", expected " << expected << std::endl;
+        ret = EXIT_FAILURE;
+      }
+    }
+    if (!known) {
+      std::cerr << "unknown property: " << arg << std::endl;
+      ret = EXIT_FAILURE;
+    }
+  }
+
   rtcReleaseGeometry(geom);
   rtcReleaseScene(scene);
   rtcReleaseDevice(device);
 
-  return 0;
-}
\ No newline at end of file
+  return ret;
+}
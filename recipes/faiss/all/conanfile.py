@@ -21,10 +21,15 @@ class FaissConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "opt_level": ["generic", "avx2", "avx512", "avx512_spr", "sve"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "opt_level": "generic",
+    }
+    options_description = {
+        "opt_level": "FAISS_OPT_LEVEL: build the SIMD distance kernels for this instruction set (x86_64: avx2, avx512, avx512_spr, armv8: sve)",
     }
 
     implements = ["auto_shared_fpic"]
@@ -32,6 +37,10 @@ class FaissConan(ConanFile):
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    @property
+    def _lib_name(self):
+        return "faiss" if self.options.opt_level == "generic" else f"faiss_{self.options.opt_level}"
+
     def requirements(self):
         self.requires("openblas/[^0.3.27]")
         self.requires("gflags/2.2.2")
@@ -46,6 +55,14 @@ class FaissConan(ConanFile):
             raise ConanInvalidConfiguration("OpenMP support is required, which is not "
                                             "available in Apple Clang")
 
+        if str(self.options.opt_level).startswith("avx") and self.settings.arch != "x86_64":
+            raise ConanInvalidConfiguration(f"{self.ref} opt_level={self.options.opt_level} is only available for x86_64")
+        if self.options.opt_level == "sve" and self.settings.arch != "armv8":
+            raise ConanInvalidConfiguration(f"{self.ref} opt_level=sve is only available for armv8")
+
+        if not self.dependencies["openblas"].options.build_lapack:
+            raise ConanInvalidConfiguration(f"{self.ref} requires LAPACK, please use -o openblas/*:build_lapack=True")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
         replace_in_file(self, os.path.join(self.source_folder, "CMakeLists.txt"),
@@ -56,6 +73,9 @@ class FaissConan(ConanFile):
         tc.cache_variables["FAISS_ENABLE_GPU"] = False
         tc.cache_variables["BUILD_TESTING"] = False
         tc.cache_variables["FAISS_ENABLE_PYTHON"] = False
+        tc.cache_variables["FAISS_OPT_LEVEL"] = str(self.options.opt_level)
+        # Make FindBLAS/FindLAPACK pick the openblas library from Conan
+        tc.cache_variables["BLA_VENDOR"] = "OpenBLAS"
         tc.cache_variables["CMAKE_TRY_COMPILE_CONFIGURATION"] = str(self.settings.build_type)
 
         tc.generate()
@@ -79,10 +99,14 @@ class FaissConan(ConanFile):
         rm(self, "*.pdb", self.package_folder, recursive=True)
 
     def package_info(self):
-        self.cpp_info.libs = ["faiss"]
+        # INFO: Each opt_level builds the generic library plus one library per enabled instruction set (faiss_avx2,
+        # faiss_avx512, ...) sharing the same symbols, so only the most optimized one must be linked.
+        self.cpp_info.libs = [self._lib_name]
 
         self.cpp_info.set_property("cmake_file_name", "faiss")
         self.cpp_info.set_property("cmake_target_name", "faiss")
+        if self._lib_name != "faiss":
+            self.cpp_info.set_property("cmake_target_aliases", [self._lib_name])
 
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.system_libs = ["m", "dl"]
@@ -71,6 +71,8 @@ class FFMpegConan(ConanFile):
         "with_vdpau": [True, False],
         "with_vulkan": [True, False],
         "with_whisper": [True, False],
+        "with_zimg": [True, False],
+        "with_vvenc": [True, False],
         "with_xcb": [True, False],
         "with_soxr": [True, False],
         "with_appkit": [True, False],
@@ -163,6 +165,8 @@ class FFMpegConan(ConanFile):
         "with_vdpau": True,
         "with_vulkan": False,
         "with_whisper": False,
+        "with_zimg": False,
+        "with_vvenc": False,
         "with_xcb": True,
         "with_soxr": False,
         "with_appkit": True,
@@ -259,6 +263,8 @@ class FFMpegConan(ConanFile):
             "with_mediacodec": ["with_jni"],
             "with_xlib": ["avdevice"],
             "with_whisper": ["avfilter"],
+            "with_zimg": ["avfilter"],
+            "with_vvenc": ["avcodec"],
         }
 
     @property
@@ -313,6 +319,8 @@ class FFMpegConan(ConanFile):
             del self.options.with_libfdk_aac
         if Version(self.version) < "5.1":
             del self.options.with_libjxl
+        if Version(self.version) < "7.1":
+            del self.options.with_vvenc
 
     def configure(self):
         if self.options.shared:
@@ -396,6 +404,10 @@ class FFMpegConan(ConanFile):
             self.requires("whisper-cpp/1.7.6")
         if self.options.get_safe("with_openapv"):
             self.requires("openapv/0.2.0.4")
+        if self.options.with_zimg:
+            self.requires("zimg/3.0.5")
+        if self.options.get_safe("with_vvenc"):
+            self.requires("vvenc/1.12.0")
 
     def validate(self):
         if self.options.with_ssl == "securetransport" and not is_apple_os(self):
@@ -592,6 +604,7 @@ class FFMpegConan(ConanFile):
             opt_enable_disable("securetransport", self.options.with_ssl == "securetransport"),
             opt_enable_disable("vulkan", self.options.get_safe("with_vulkan")),
             opt_enable_disable("libdav1d", self.options.get_safe("with_libdav1d")),
+            opt_enable_disable("libzimg", self.options.with_zimg),
             opt_enable_disable("jni", self.options.get_safe("with_jni")),
             opt_enable_disable("mediacodec", self.options.get_safe("with_mediacodec")),
             opt_enable_disable("xlib", self.options.get_safe("with_xlib")),
@@ -673,6 +686,8 @@ class FFMpegConan(ConanFile):
             args.append(opt_enable_disable("whisper", self.options.with_whisper))
         if "with_openapv" in self.options:
             args.append(opt_enable_disable("liboapv", self.options.with_openapv))
+        if "with_vvenc" in self.options:
+            args.append(opt_enable_disable("libvvenc", self.options.with_vvenc))
 
         if self._version_supports_libsvtav1:
             args.append(opt_enable_disable("libsvtav1", self.options.get_safe("with_libsvtav1")))
@@ -775,6 +790,7 @@ class FFMpegConan(ConanFile):
         deps = PkgConfigDeps(self)
         deps.set_property("whisper-cpp", "pkg_config_name", "whisper")
         deps.set_property("openapv", "pkg_config_name", "oapv")
+        deps.set_property("vvenc", "pkg_config_name", "libvvenc")
         deps.generate()
 
         if self.options.with_ssl == "openssl":
@@ -980,6 +996,8 @@ class FFMpegConan(ConanFile):
                 avcodec.requires.append("libjxl::libjxl")
             if self.options.get_safe("with_openapv"):
                 avcodec.requires.append("openapv::openapv")
+            if self.options.get_safe("with_vvenc"):
+                avcodec.requires.append("vvenc::vvenc")
 
         if self.options.avformat:
             if self.options.with_bzip2:
@@ -1010,6 +1028,8 @@ class FFMpegConan(ConanFile):
                 avfilter.frameworks.append("Metal")
             if self.options.get_safe("with_whisper"):
                 avfilter.requires.append("whisper-cpp::whisper-cpp")
+            if self.options.with_zimg:
+                avfilter.requires.append("zimg::zimg")
 
         if self.options.get_safe("with_libdrm"):
             avutil.requires.append("libdrm::libdrm_libdrm")
@@ -1,12 +1,12 @@
 from conan import ConanFile
 from conan.tools.build import can_run
-from conan.tools.cmake import CMake, cmake_layout
+from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 import os
 
 
 class TestPackageConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
-    generators = "CMakeDeps", "CMakeToolchain", "VirtualRunEnv"
+    generators = "CMakeDeps", "VirtualRunEnv"
     test_type = "explicit"
 
     def layout(self):
@@ -15,6 +15,13 @@ class TestPackageConan(ConanFile):
     def requirements(self):
         self.requires(self.tested_reference_str)
 
+    def generate(self):
+        ffmpeg_options = self.dependencies["ffmpeg"].options
+        tc = CMakeToolchain(self)
+        tc.cache_variables["TEST_FFMPEG_ZIMG"] = bool(ffmpeg_options.get_safe("with_zimg"))
+        tc.cache_variables["TEST_FFMPEG_VVENC"] = bool(ffmpeg_options.get_safe("with_vvenc"))
+        tc.generate()
+
     def build(self):
         cmake = CMake(self)
         cmake.configure()
@@ -26,11 +26,23 @@ int main()
     #ifdef HAVE_FFMPEG_AVCODEC
         printf("configuration: %s\n", avcodec_configuration());
         printf("avcodec version: %d.%d.%d\n", AV_VERSION_MAJOR(avcodec_version()), AV_VERSION_MINOR(avcodec_version()), AV_VERSION_MICRO(avcodec_version()));
+        #ifdef TEST_FFMPEG_VVENC
+            if (!avcodec_find_encoder_by_name("libvvenc")) {
+                printf("libvvenc encoder is not available!\n");
+                return EXIT_FAILURE;
+            }
+        #endif
     #else
         printf("avcodec is disabled!\n");
     #endif
     #ifdef HAVE_FFMPEG_AVFILTER
         printf("avfilter version: %d.%d.%d\n", AV_VERSION_MAJOR(avfilter_version()), AV_VERSION_MINOR(avfilter_version()), AV_VERSION_MICRO(avfilter_version()));
+        #ifdef TEST_FFMPEG_ZIMG
+            if (!avfilter_get_by_name("zscale")) {
+                printf("zscale filter is not available!\n");
+                return EXIT_FAILURE;
+            }
+        #endif
     #else
         printf("avfilter is disabled!\n");
     #endif
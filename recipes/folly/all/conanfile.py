@@ -8,6 +8,7 @@ from conan.tools.files import get, copy, rmdir, replace_in_file, save, rm
 from conan.tools.microsoft import is_msvc, is_msvc_static_runtime
 from conan.tools.scm import Version
 import os
+import textwrap
 
 
 required_conan_version = ">=2.1"
@@ -26,10 +27,12 @@ class FollyConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "with_jemalloc": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "with_jemalloc": False,
     }
 
     @property
@@ -53,6 +56,8 @@ class FollyConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+            # jemalloc does not replace the system allocator on Windows, folly::usingJEMalloc() would be always false
+            del self.options.with_jemalloc
 
     def configure(self):
         if self.options.shared:
@@ -88,6 +93,9 @@ class FollyConan(ConanFile):
             self.requires("liburing/2.6")
         # INFO: Folly does not support fmt 11 on MSVC: https://github.com/facebook/folly/issues/2250
         self.requires("fmt/10.2.1", transitive_headers=True, transitive_libs=True)
+        if self.options.get_safe("with_jemalloc"):
+            # INFO: folly/memory/Malloc.h includes jemalloc/jemalloc.h when FOLLY_USE_JEMALLOC is defined
+            self.requires("jemalloc/5.3.0", transitive_headers=True, transitive_libs=True)
 
     def build_requirements(self):
         # INFO: Required due ZIP_LISTS CMake feature in conan_deps.cmake
@@ -128,6 +136,10 @@ class FollyConan(ConanFile):
             required_components = ", ".join(self._required_boost_components)
             raise ConanInvalidConfiguration(f"{self.ref} requires these Boost components: {required_components}. Try with '-o boost/*:without_{required_components}=False'")
 
+        if self.options.get_safe("with_jemalloc") and self.dependencies["jemalloc"].options.prefix:
+            # folly calls mallocx/nallocx/sdallocx directly, which are renamed by a jemalloc prefix
+            raise ConanInvalidConfiguration(f"{self.ref} requires jemalloc without symbol prefix. Use -o 'jemalloc/*:prefix='")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=False)
 
@@ -178,6 +190,8 @@ class FollyConan(ConanFile):
         deps.set_property("bzip2", "cmake_file_name", "BZip2")
         deps.set_property("double-conversion", "cmake_file_name", "DoubleConversion")
         deps.set_property("fmt", "cmake_file_name", "fmt")
+        deps.set_property("jemalloc", "cmake_file_name", "jemalloc")
+        deps.set_property("jemalloc", "cmake_target_name", "jemalloc::jemalloc")
         deps.set_property("gflags", "cmake_file_name", "Gflags")
         deps.set_property("glog", "cmake_file_name", "Glog")
         deps.set_property("libdwarf", "cmake_file_name", "LibDwarf")
@@ -200,6 +214,13 @@ class FollyConan(ConanFile):
         replace_in_file(self, folly_deps, " MODULE", " REQUIRED CONFIG")
         replace_in_file(self, folly_deps, "${Boost_LIBRARIES}", f"{' '.join(self._required_boost_cmake_targets)}")
         replace_in_file(self, folly_deps, "OpenSSL 1.1.1", "OpenSSL")
+        if self.options.get_safe("with_jemalloc"):
+            # Folly has no jemalloc detection, it only relies on FOLLY_USE_JEMALLOC being defined
+            save(self, folly_deps, textwrap.dedent("""
+                find_package(jemalloc REQUIRED CONFIG)
+                target_link_libraries(folly_deps INTERFACE jemalloc::jemalloc)
+                target_compile_definitions(folly_deps INTERFACE FOLLY_USE_JEMALLOC=1)
+            """), append=True)
         # Disable example
         save(self, os.path.join(self.source_folder, "folly", "logging", "example", "CMakeLists.txt"), "")
         # Disable custom find modules to use Conan CMakeDeps instead
@@ -245,6 +266,9 @@ class FollyConan(ConanFile):
         ]
         if not is_msvc(self):
             self.cpp_info.components["libfolly"].requires.append("libdwarf::libdwarf")
+        if self.options.get_safe("with_jemalloc"):
+            self.cpp_info.components["libfolly"].requires.append("jemalloc::jemalloc")
+            self.cpp_info.components["libfolly"].defines.append("FOLLY_USE_JEMALLOC=1")
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["libfolly"].requires.extend(["libiberty::libiberty", "libunwind::libunwind"])
         if self.settings.os == "Linux":
@@ -14,6 +14,7 @@ class TestPackageConan(ConanFile):
 
     def generate(self):
         tc = CMakeToolchain(self)
+        tc.cache_variables["FOLLY_WITH_JEMALLOC"] = bool(self.dependencies["folly"].options.get_safe("with_jemalloc"))
         tc.generate()
 
     def layout(self):
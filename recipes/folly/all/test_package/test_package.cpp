@@ -3,10 +3,17 @@
 
 #include <folly/Format.h>
 #include <folly/IPAddress.h>
+#include <folly/memory/Malloc.h>
 
 
 int main() {
     folly::fbstring address{"127.0.0.1"};
     folly::IPAddress::validate(address);
+#ifdef TEST_FOLLY_JEMALLOC
+    if (!folly::usingJEMalloc()) {
+        std::cerr << "folly was built with jemalloc, but it is not in use" << std::endl;
+        return EXIT_FAILURE;
+    }
+#endif
     return EXIT_SUCCESS;
 }
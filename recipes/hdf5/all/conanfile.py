@@ -33,6 +33,8 @@ class Hdf5Conan(ConanFile):
         "szip_encoding": [True, False],
         "parallel": [True, False],
         "enable_unsupported": [True, False],
+        "enable_direct_vfd": [True, False],
+        "enable_subfiling_vfd": [True, False],
     }
     default_options = {
         "shared": False,
@@ -45,7 +47,9 @@ class Hdf5Conan(ConanFile):
         "szip_support": None,
         "szip_encoding": False,
         "parallel": False,
-        "enable_unsupported": False
+        "enable_unsupported": False,
+        "enable_direct_vfd": False,
+        "enable_subfiling_vfd": False,
     }
 
     def export_sources(self):
@@ -98,6 +102,11 @@ class Hdf5Conan(ConanFile):
             raise ConanInvalidConfiguration("with_zlibng=True is incompatible with versions prior to v1.14.5")
         if self.options.enable_cxx:
             check_min_cppstd(self, "11")
+        if self.options.enable_direct_vfd and self.settings.os != "Linux":
+            # O_DIRECT and posix_memalign are required by the Direct I/O VFD
+            raise ConanInvalidConfiguration("enable_direct_vfd=True is only supported on Linux")
+        if self.options.enable_subfiling_vfd and not self.options.parallel:
+            raise ConanInvalidConfiguration("enable_subfiling_vfd=True requires parallel=True")
 
     def validate_build(self):
         if cross_building(self) and Version(self.version) < "1.14.4.3":
@@ -141,6 +150,8 @@ class Hdf5Conan(ConanFile):
         tc.variables["HDF5_USE_ZLIB_NG"] = self.options.get_safe("with_zlibng", False)
         tc.variables["HDF5_PACKAGE_EXTLIBS"] = False
         tc.variables["HDF5_ENABLE_THREADSAFE"] = self.options.get_safe("threadsafe", False)
+        tc.variables["HDF5_ENABLE_DIRECT_VFD"] = self.options.enable_direct_vfd
+        tc.variables["HDF5_ENABLE_SUBFILING_VFD"] = self.options.enable_subfiling_vfd
         tc.variables["HDF5_ENABLE_DEBUG_APIS"] = False # Option?
         tc.variables["BUILD_TESTING"] = False
 
@@ -276,7 +287,7 @@ class Hdf5Conan(ConanFile):
         self.cpp_info.components["hdf5_c"].includedirs.append(os.path.join("include", "hdf5"))
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["hdf5_c"].system_libs.extend(["dl", "m"])
-            if self.options.get_safe("threadsafe"):
+            if self.options.get_safe("threadsafe") or self.options.enable_subfiling_vfd:
                 self.cpp_info.components["hdf5_c"].system_libs.append("pthread")
         elif self.settings.os == "Windows":
             self.cpp_info.components["hdf5_c"].system_libs.append("Shlwapi")
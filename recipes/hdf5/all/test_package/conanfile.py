@@ -21,6 +21,7 @@ class TestPackageConan(ConanFile):
         tc.variables.update({
             "HDF5_CXX": self.dependencies["hdf5"].options.enable_cxx,
             "HDF5_HL": self.dependencies["hdf5"].options.hl,
+            "HDF5_DIRECT_VFD": self.dependencies["hdf5"].options.enable_direct_vfd,
         })
         tc.generate()
 
@@ -33,6 +33,26 @@ void test_c_api()
     status = H5Fclose(file_id);
 }
 
+#ifdef CONAN_HDF5_DIRECT_VFD
+int test_direct_vfd()
+{
+    hid_t  fapl_id;
+    size_t alignment, block_size, cbuf_size;
+    int    ok;
+
+    fapl_id = H5Pcreate(H5P_FILE_ACCESS);
+    if (H5Pset_fapl_direct(fapl_id, 4096, 4096, 16 * 1024 * 1024) < 0) {
+        H5Pclose(fapl_id);
+        return 0;
+    }
+    ok = H5Pget_driver(fapl_id) == H5FD_DIRECT
+        && H5Pget_fapl_direct(fapl_id, &alignment, &block_size, &cbuf_size) >= 0
+        && alignment == 4096 && block_size == 4096 && cbuf_size == 16 * 1024 * 1024;
+    H5Pclose(fapl_id);
+    return ok;
+}
+#endif
+
 int main(int argc, char **argv)
 {
     printf("Testing C API\n");
@@ -41,6 +61,13 @@ int main(int argc, char **argv)
     printf("Testing C++ API\n");
     test_cxx_api();
     #endif
+    #ifdef CONAN_HDF5_DIRECT_VFD
+    printf("Testing Direct I/O VFD\n");
+    if (!test_direct_vfd()) {
+        printf("Direct I/O VFD is not available\n");
+        return 1;
+    }
+    #endif
     #ifdef CONAN_HDF5_PARALLEL
     printf("Testing HDF5 Parallel\n");
     test_parallel(argc, argv);
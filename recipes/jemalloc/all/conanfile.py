@@ -35,6 +35,11 @@ class JemallocConan(ConanFile):
         "enable_initial_exec_tls": [True, False],
         "enable_libdl": [True, False],
         "enable_prof": [True, False],
+        "enable_stats": [True, False],
+        "lg_page": [None, "ANY"],
+        "lg_quantum": [None, "ANY"],
+        "lg_hugepage": [None, "ANY"],
+        "malloc_conf": [None, "ANY"],
     }
     default_options = {
         "shared": False,
@@ -50,6 +55,11 @@ class JemallocConan(ConanFile):
         "enable_initial_exec_tls": True,
         "enable_libdl": True,
         "enable_prof": False,
+        "enable_stats": True,
+        "lg_page": None,        # Detected by configure on the build machine
+        "lg_quantum": None,     # Uses default value from source
+        "lg_hugepage": None,    # Detected by configure on the build machine
+        "malloc_conf": None,
     }
 
     @property
@@ -64,6 +74,25 @@ class JemallocConan(ConanFile):
             "msvc": "191",
         }
 
+    @property
+    def _supported_lg_pages(self):
+        # Base-2 log of the system page sizes supported by the kernels running on each architecture
+        arch = str(self.settings.arch)
+        if arch in ["x86", "x86_64"]:
+            return [12]
+        if arch.startswith("armv8"):
+            return [12, 14, 16]
+        if arch.startswith("ppc64"):
+            return [12, 16]
+        return [12, 13, 14, 15, 16]
+
+    @property
+    def _min_lg_quantum(self):
+        # The quantum must honor the fundamental alignment of the platform ABI
+        if self.settings.arch in ["x86_64", "armv8", "ppc64", "ppc64le", "s390x", "riscv64"]:
+            return 4
+        return 3
+
     @property
     def _settings_build(self):
         return getattr(self, "settings_build", self.settings)
@@ -125,6 +154,23 @@ class JemallocConan(ConanFile):
             if Version(self.version) < "5.3.0":
                 raise ConanInvalidConfiguration("Support for Apple Silicon is only available as of 5.3.0.")
 
+        # 4. Size class configuration checks
+        for option in ["lg_page", "lg_quantum", "lg_hugepage"]:
+            value = self.options.get_safe(option)
+            if value and not str(value).isdigit():
+                raise ConanInvalidConfiguration(f"{option} must be a base-2 logarithm, e.g. 12 for 4 KiB, got '{value}'")
+        if self.options.lg_page and int(self.options.lg_page) not in self._supported_lg_pages:
+            raise ConanInvalidConfiguration(
+                f"lg_page={self.options.lg_page} is not a valid page size for {self.settings.arch}. "
+                f"Valid values: {', '.join(str(v) for v in self._supported_lg_pages)}")
+        if self.options.lg_quantum and not self._min_lg_quantum <= int(self.options.lg_quantum) <= 8:
+            raise ConanInvalidConfiguration(
+                f"lg_quantum must be between {self._min_lg_quantum} and 8 on {self.settings.arch}")
+        if self.options.lg_hugepage:
+            lg_page = int(self.options.lg_page) if self.options.lg_page else min(self._supported_lg_pages)
+            if not lg_page < int(self.options.lg_hugepage) <= 30:
+                raise ConanInvalidConfiguration(f"lg_hugepage must be greater than lg_page ({lg_page}) and lower or equal to 30")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
 
@@ -146,7 +192,16 @@ class JemallocConan(ConanFile):
             enable_disable("initial-exec-tls", self.options.enable_initial_exec_tls),
             enable_disable("libdl", self.options.enable_libdl),
             enable_disable("prof", self.options.enable_prof),
+            enable_disable("stats", self.options.enable_stats),
         ])
+        if self.options.lg_page:
+            tc.configure_args.append(f"--with-lg-page={self.options.lg_page}")
+        if self.options.lg_quantum:
+            tc.configure_args.append(f"--with-lg-quantum={self.options.lg_quantum}")
+        if self.options.lg_hugepage:
+            tc.configure_args.append(f"--with-lg-hugepage={self.options.lg_hugepage}")
+        if self.options.malloc_conf:
+            tc.configure_args.append(f"--with-malloc-conf={self.options.malloc_conf}")
         env = tc.environment()
         if is_msvc(self):
             # Do not check whether the math library exists when compiled by MSVC
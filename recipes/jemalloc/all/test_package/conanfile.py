@@ -1,12 +1,12 @@
 from conan import ConanFile
 from conan.tools.build import can_run
-from conan.tools.cmake import CMake, cmake_layout
+from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 import os
 
 
 class TestPackageConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
-    generators = "CMakeDeps", "CMakeToolchain", "VirtualRunEnv"
+    generators = "CMakeDeps", "VirtualRunEnv"
     test_type = "explicit"
 
     def requirements(self):
@@ -15,6 +15,13 @@ class TestPackageConan(ConanFile):
     def layout(self):
         cmake_layout(self)
 
+    def generate(self):
+        jemalloc_options = self.dependencies["jemalloc"].options
+        tc = CMakeToolchain(self)
+        tc.cache_variables["JEMALLOC_WITH_STATS"] = bool(jemalloc_options.enable_stats)
+        tc.cache_variables["JEMALLOC_MALLOC_CONF"] = str(jemalloc_options.malloc_conf or "")
+        tc.generate()
+
     def build(self):
         cmake = CMake(self)
         cmake.configure()
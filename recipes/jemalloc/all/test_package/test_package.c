@@ -1,6 +1,9 @@
 #include <jemalloc/jemalloc.h>
 
+#include <stdbool.h>
+#include <stdio.h>
 #include <stdlib.h>
+#include <string.h>
 
 void do_something(size_t i) {
     // Leak some memory.
@@ -8,6 +11,12 @@ void do_something(size_t i) {
 }
 
 int main() {
+    bool config_stats = false;
+    size_t size = sizeof(config_stats);
+#ifdef TEST_JEMALLOC_MALLOC_CONF
+    const char *config_malloc_conf = NULL;
+#endif
+
     for (size_t i = 0; i < 1000; i++) {
         do_something(i);
     }
@@ -15,5 +24,30 @@ int main() {
     // Dump allocator statistics to stderr.
     malloc_stats_print(NULL, NULL, NULL);
 
+    // Check the build configuration baked into the library.
+    if (mallctl("config.stats", &config_stats, &size, NULL, 0) != 0) {
+        return EXIT_FAILURE;
+    }
+#ifdef TEST_JEMALLOC_STATS
+    if (!config_stats) {
+        fprintf(stderr, "jemalloc was expected to be built with statistics\n");
+        return EXIT_FAILURE;
+    }
+#else
+    if (config_stats) {
+        fprintf(stderr, "jemalloc was expected to be built without statistics\n");
+        return EXIT_FAILURE;
+    }
+#endif
+
+#ifdef TEST_JEMALLOC_MALLOC_CONF
+    size = sizeof(config_malloc_conf);
+    if (mallctl("config.malloc_conf", &config_malloc_conf, &size, NULL, 0) != 0 ||
+        strcmp(config_malloc_conf, TEST_JEMALLOC_MALLOC_CONF) != 0) {
+        fprintf(stderr, "jemalloc was expected to be built with malloc_conf \"%s\"\n", TEST_JEMALLOC_MALLOC_CONF);
+        return EXIT_FAILURE;
+    }
+#endif
+
     return 0;
 }
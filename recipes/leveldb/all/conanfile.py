@@ -25,12 +25,14 @@ class LevelDBCppConan(ConanFile):
         "fPIC": [True, False],
         "with_snappy": [True, False],
         "with_crc32c": [True, False],
+        "with_tcmalloc": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "with_snappy": True,
         "with_crc32c": True,
+        "with_tcmalloc": False,
     }
 
     def export_sources(self):
@@ -39,6 +41,8 @@ class LevelDBCppConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+            # gperftools does not support Windows
+            del self.options.with_tcmalloc
 
     def configure(self):
         if self.options.shared:
@@ -48,13 +52,12 @@ class LevelDBCppConan(ConanFile):
         cmake_layout(self, src_folder="src")
 
     def requirements(self):
-        # FIXME: tcmalloc is also conditionally included in leveldb, but
-        # there is no "official" conan package yet; when that is available, we
-        # can add similar with options for those
         if self.options.with_snappy:
             self.requires("snappy/1.1.10")
         if self.options.with_crc32c:
             self.requires("crc32c/1.1.2")
+        if self.options.get_safe("with_tcmalloc"):
+            self.requires("gperftools/2.17.2")
 
     def validate(self):
         if self.settings.compiler.get_safe("cppstd"):
@@ -69,6 +72,7 @@ class LevelDBCppConan(ConanFile):
         tc.variables["LEVELDB_BUILD_BENCHMARKS"] = False
         tc.variables["HAVE_SNAPPY"] = self.options.with_snappy
         tc.variables["HAVE_CRC32C"] = self.options.with_crc32c
+        tc.variables["HAVE_TCMALLOC"] = self.options.get_safe("with_tcmalloc", False)
         tc.generate()
         deps = CMakeDeps(self)
         deps.generate()
@@ -8,6 +8,7 @@ from conan.tools.files import copy, download, get, load, replace_in_file, rm, rm
 from conan.tools.gnu import Autotools, AutotoolsToolchain, AutotoolsDeps, PkgConfigDeps
 from conan.tools.layout import basic_layout
 from conan.tools.microsoft import is_msvc, unix_path
+from conan.tools.scm import Version
 
 import os
 import re
@@ -53,6 +54,7 @@ class LibcurlConan(ConanFile):
         "with_libpsl": [True, False],
         "with_largemaxwritesize": [True, False],
         "with_nghttp2": [True, False],
+        "with_nghttp3": [True, False],
         "with_zlib": [True, False],
         "with_brotli": [True, False],
         "with_zstd": [True, False],
@@ -102,6 +104,7 @@ class LibcurlConan(ConanFile):
         "with_libpsl": False,
         "with_largemaxwritesize": False,
         "with_nghttp2": False,
+        "with_nghttp3": False,
         "with_zlib": True,
         "with_brotli": False,
         "with_zstd": False,
@@ -170,6 +173,8 @@ class LibcurlConan(ConanFile):
             self.requires("mbedtls/3.5.0")
         if self.options.with_nghttp2:
             self.requires("libnghttp2/[>=1.59.0 <2]")
+        if self.options.with_nghttp3:
+            self.requires("nghttp3/1.12.0")
         if self.options.with_libssh2:
             self.requires("libssh2/1.11.0")
         if self.options.with_zlib:
@@ -197,6 +202,14 @@ class LibcurlConan(ConanFile):
                 raise ConanInvalidConfiguration("option with_ntlm=True requires openssl/*:no_des=False")
         if self.options.with_ssl == "wolfssl" and not self.dependencies["wolfssl"].options.with_curl:
             raise ConanInvalidConfiguration("option with_ssl=wolfssl requires wolfssl/*:with_curl=True")
+        if self.options.with_nghttp3:
+            # HTTP/3 is only provided through the native QUIC stack of OpenSSL, ngtcp2 is not available in CCI (yet)
+            if self.options.with_ssl != "openssl":
+                raise ConanInvalidConfiguration("option with_nghttp3=True requires with_ssl=openssl")
+            if Version(self.dependencies["openssl"].ref.version) < "3.3.0":
+                raise ConanInvalidConfiguration("option with_nghttp3=True requires openssl >= 3.3.0 (OpenSSL QUIC client API)")
+            if not self.options.with_http:
+                raise ConanInvalidConfiguration("option with_nghttp3=True requires with_http=True")
 
     def build_requirements(self):
         if self._is_using_cmake_build:
@@ -411,6 +424,13 @@ class LibcurlConan(ConanFile):
         else:
             tc.configure_args.append("--without-nghttp2")
 
+        if self.options.with_nghttp3:
+            path = unix_path(self, self.dependencies["nghttp3"].package_folder)
+            tc.configure_args.append(f"--with-nghttp3={path}")
+            tc.configure_args.append("--with-openssl-quic")
+        else:
+            tc.configure_args.append("--without-nghttp3")
+
         if self.options.with_zlib:
             path = unix_path(self, self.dependencies["zlib"].package_folder)
             tc.configure_args.append(f"--with-zlib={path}")
@@ -544,6 +564,8 @@ class LibcurlConan(ConanFile):
         tc.variables["CURL_USE_WOLFSSL"] = self.options.with_ssl == "wolfssl"
         tc.variables["CURL_USE_MBEDTLS"] = self.options.with_ssl == "mbedtls"
         tc.variables["USE_NGHTTP2"] = self.options.with_nghttp2
+        tc.variables["USE_NGHTTP3"] = self.options.with_nghttp3
+        tc.variables["USE_OPENSSL_QUIC"] = self.options.with_nghttp3
         tc.variables["CURL_ZLIB"] = self.options.with_zlib
         tc.variables["CURL_BROTLI"] = self.options.with_brotli
         tc.variables["CURL_ZSTD"] = self.options.with_zstd
@@ -637,6 +659,10 @@ class LibcurlConan(ConanFile):
             deps.set_property("libnghttp2", "cmake_file_name", "NGHTTP2")
             deps.set_property("libnghttp2", "cmake_target_name", "CURL::nghttp2")
 
+        if self.options.with_nghttp3:
+            deps.set_property("nghttp3", "cmake_file_name", "NGHTTP3")
+            deps.set_property("nghttp3", "cmake_target_name", "CURL::nghttp3")
+
         if self.options.with_ssl == "wolfssl":
             deps.set_property("wolfssl", "cmake_target_name", "CURL::wolfssl")
         # Now the rest of the dependencies that don't use the imported target directly
@@ -719,6 +745,8 @@ class LibcurlConan(ConanFile):
             self.cpp_info.components["curl"].requires.append("mbedtls::mbedtls")
         if self.options.with_nghttp2:
             self.cpp_info.components["curl"].requires.append("libnghttp2::libnghttp2")
+        if self.options.with_nghttp3:
+            self.cpp_info.components["curl"].requires.append("nghttp3::nghttp3")
         if self.options.with_libssh2:
             self.cpp_info.components["curl"].requires.append("libssh2::libssh2")
         if self.options.with_zlib:
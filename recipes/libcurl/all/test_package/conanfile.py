@@ -1,6 +1,6 @@
 from conan import ConanFile
 from conan.tools.build import can_run
-from conan.tools.cmake import cmake_layout, CMake
+from conan.tools.cmake import cmake_layout, CMake, CMakeToolchain
 import os
 import subprocess
 import re
@@ -8,15 +8,29 @@ import re
 
 class TestPackageConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
-    generators = "CMakeDeps", "CMakeToolchain", "VirtualRunEnv"
+    generators = "CMakeDeps", "VirtualRunEnv"
     test_type = "explicit"
 
+    @property
+    def _has_http2_server(self):
+        # The loopback HTTP/2 server relies on POSIX sockets and threads
+        return self.settings.os in ["Linux", "FreeBSD", "Macos"]
+
     def requirements(self):
         self.requires(self.tested_reference_str)
+        if self._has_http2_server:
+            # nghttp2_submit_response2() and the other *2 APIs need 1.62.0
+            self.requires("libnghttp2/[>=1.62.0 <2]")
 
     def layout(self):
         cmake_layout(self)
 
+    def generate(self):
+        tc = CMakeToolchain(self)
+        tc.cache_variables["TEST_HTTP2_SERVER"] = self._has_http2_server and \
+            bool(self.dependencies[self.tested_reference_str].options.with_nghttp2)
+        tc.generate()
+
     def build(self):
         cmake = CMake(self)
         cmake.configure()
@@ -32,6 +46,16 @@ class TestPackageConan(ConanFile):
             assert os.path.exists(os.path.join(self.dependencies[self.tested_reference_str].cpp_info.bindir, f"curl{ext}"))
 
         if can_run(self):
-            self.run(self._test_executable, env="conanrun")
+            curl_options = self.dependencies[self.tested_reference_str].options
+            features = []
+            if curl_options.with_nghttp3:
+                features.append("http3")
+            if curl_options.with_nghttp2:
+                features.append("http2")
+            if curl_options.with_c_ares:
+                features.append("c-ares")
+            elif curl_options.with_threaded_resolver:
+                features.append("asynchdns")
+            self.run(" ".join([self._test_executable] + features), env="conanrun")
             if self.dependencies[self.tested_reference_str].options.build_executable:
                 self.run("curl --version", env="conanrun")
@@ -0,0 +1,202 @@
+/* Minimal loopback HTTP/2 (h2c, prior knowledge) server built on libnghttp2.
+ * Every request is answered with a short 200 response, and the number of
+ * accepted TCP connections is recorded so the client can verify that its
+ * requests were multiplexed and that cached connections were reused. */
+#include "http2_server.h"
+
+#include <nghttp2/nghttp2.h>
+
+#include <arpa/inet.h>
+#include <netinet/in.h>
+#include <poll.h>
+#include <pthread.h>
+#include <stdint.h>
+#include <string.h>
+#include <sys/socket.h>
+#include <unistd.h>
+
+#define MAX_CONNECTIONS 16
+
+static const char response_body[] = "ok";
+
+struct server {
+  int listen_fd;
+  int stop;
+  int connections;
+  pthread_t accept_thread;
+  pthread_t connection_threads[MAX_CONNECTIONS];
+  pthread_mutex_t lock;
+};
+
+static struct server server;
+
+static nghttp2_ssize send_callback(nghttp2_session *session,
+                                   const uint8_t *data, size_t length,
+                                   int flags, void *user_data)
+{
+  int fd = *(int *)user_data;
+  ssize_t n;
+  (void)session;
+  (void)flags;
+  n = send(fd, data, length, 0);
+  return n < 0 ? NGHTTP2_ERR_CALLBACK_FAILURE : (nghttp2_ssize)n;
+}
+
+static nghttp2_ssize body_read_callback(nghttp2_session *session,
+                                        int32_t stream_id, uint8_t *buf,
+                                        size_t length, uint32_t *data_flags,
+                                        nghttp2_data_source *source,
+                                        void *user_data)
+{
+  size_t size = sizeof(response_body) - 1;
+  (void)session;
+  (void)stream_id;
+  (void)source;
+  (void)user_data;
+  if(size > length)
+    size = length;
+  memcpy(buf, response_body, size);
+  *data_flags |= NGHTTP2_DATA_FLAG_EOF;
+  return (nghttp2_ssize)size;
+}
+
+static int on_frame_recv_callback(nghttp2_session *session,
+                                  const nghttp2_frame *frame, void *user_data)
+{
+  nghttp2_nv headers[] = {
+    {(uint8_t *)":status", (uint8_t *)"200", 7, 3, NGHTTP2_NV_FLAG_NONE},
+  };
+  nghttp2_data_provider2 provider;
+  (void)user_data;
+
+  if((frame->hd.type == NGHTTP2_HEADERS || frame->hd.type == NGHTTP2_DATA) &&
+     (frame->hd.flags & NGHTTP2_FLAG_END_STREAM) && frame->hd.stream_id) {
+    provider.source.ptr = NULL;
+    provider.read_callback = body_read_callback;
+    return nghttp2_submit_response2(session, frame->hd.stream_id, headers,
+                                    sizeof(headers) / sizeof(headers[0]),
+                                    &provider);
+  }
+  return 0;
+}
+
+static void *connection_thread(void *arg)
+{
+  int fd = (int)(intptr_t)arg;
+  nghttp2_session_callbacks *callbacks;
+  nghttp2_session *session;
+  nghttp2_settings_entry settings[] = {
+    {NGHTTP2_SETTINGS_MAX_CONCURRENT_STREAMS, 100},
+  };
+  uint8_t buf[16384];
+
+  nghttp2_session_callbacks_new(&callbacks);
+  nghttp2_session_callbacks_set_send_callback2(callbacks, send_callback);
+  nghttp2_session_callbacks_set_on_frame_recv_callback(callbacks,
+                                                       on_frame_recv_callback);
+  nghttp2_session_server_new(&session, callbacks, &fd);
+  nghttp2_session_callbacks_del(callbacks);
+
+  nghttp2_submit_settings(session, NGHTTP2_FLAG_NONE, settings,
+                          sizeof(settings) / sizeof(settings[0]));
+  while(nghttp2_session_want_read(session) ||
+        nghttp2_session_want_write(session)) {
+    ssize_t n;
+    if(nghttp2_session_send(session) != 0)
+      break;
+    n = recv(fd, buf, sizeof(buf), 0);
+    if(n <= 0)
+      break;
+    if(nghttp2_session_mem_recv2(session, buf, (size_t)n) < 0)
+      break;
+  }
+
+  nghttp2_session_del(session);
+  close(fd);
+  return NULL;
+}
+
+static void *accept_thread(void *arg)
+{
+  struct pollfd pfd;
+  (void)arg;
+
+  pfd.fd = server.listen_fd;
+  pfd.events = POLLIN;
+  for(;;) {
+    int fd;
+    pthread_mutex_lock(&server.lock);
+    if(server.stop) {
+      pthread_mutex_unlock(&server.lock);
+      break;
+    }
+    pthread_mutex_unlock(&server.lock);
+
+    if(poll(&pfd, 1, 100) <= 0)
+      continue;
+    fd = accept(server.listen_fd, NULL, NULL);
+    if(fd < 0)
+      continue;
+
+    pthread_mutex_lock(&server.lock);
+    if(server.connections < MAX_CONNECTIONS &&
+       pthread_create(&server.connection_threads[server.connections], NULL,
+                      connection_thread, (void *)(intptr_t)fd) == 0)
+      server.connections++;
+    else
+      close(fd);
+    pthread_mutex_unlock(&server.lock);
+  }
+  return NULL;
+}
+
+int http2_server_start(void)
+{
+  struct sockaddr_in addr;
+  socklen_t addrlen = sizeof(addr);
+
+  memset(&server, 0, sizeof(server));
+  pthread_mutex_init(&server.lock, NULL);
+
+  server.listen_fd = socket(AF_INET, SOCK_STREAM, 0);
+  if(server.listen_fd < 0)
+    return -1;
+
+  memset(&addr, 0, sizeof(addr));
+  addr.sin_family = AF_INET;
+  addr.sin_addr.s_addr = htonl(INADDR_LOOPBACK);
+  addr.sin_port = 0;
+  if(bind(server.listen_fd, (struct sockaddr *)&addr, sizeof(addr)) != 0 ||
+     listen(server.listen_fd, MAX_CONNECTIONS) != 0 ||
+     getsockname(server.listen_fd, (struct sockaddr *)&addr, &addrlen) != 0 ||
+     pthread_create(&server.accept_thread, NULL, accept_thread, NULL) != 0) {
+    close(server.listen_fd);
+    return -1;
+  }
+  return ntohs(addr.sin_port);
+}
+
+int http2_server_connections(void)
+{
+  int connections;
+  pthread_mutex_lock(&server.lock);
+  connections = server.connections;
+  pthread_mutex_unlock(&server.lock);
+  return connections;
+}
+
+void http2_server_stop(void)
+{
+  int i;
+
+  pthread_mutex_lock(&server.lock);
+  server.stop = 1;
+  pthread_mutex_unlock(&server.lock);
+  pthread_join(server.accept_thread, NULL);
+  close(server.listen_fd);
+
+  /* connection threads end once the client has closed its side */
+  for(i = 0; i < server.connections; i++)
+    pthread_join(server.connection_threads[i], NULL);
+  pthread_mutex_destroy(&server.lock);
+}
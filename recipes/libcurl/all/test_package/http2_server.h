@@ -0,0 +1,13 @@
+#ifndef HTTP2_SERVER_H
+#define HTTP2_SERVER_H
+
+/* Starts the server on a loopback ephemeral port, returns the port or -1 */
+int http2_server_start(void);
+
+/* Number of TCP connections accepted so far */
+int http2_server_connections(void);
+
+/* Stops the server; all client connections must be closed beforehand */
+void http2_server_stop(void);
+
+#endif
@@ -1,8 +1,179 @@
 #include <stdio.h>
+#include <string.h>
 #include <curl/curl.h>
 
-int main(void)
+#ifdef TEST_HTTP2_SERVER
+#include "http2_server.h"
+
+#define PARALLEL_REQUESTS 4
+
+static size_t discard_body(char *ptr, size_t size, size_t nmemb, void *userdata)
+{
+  (void)ptr;
+  (void)userdata;
+  return size * nmemb;
+}
+
+static CURL *new_request(int port, int index)
+{
+  char url[64];
+  CURL *curl = curl_easy_init();
+  snprintf(url, sizeof(url), "http://127.0.0.1:%d/%d", port, index);
+  curl_easy_setopt(curl, CURLOPT_URL, url);
+  curl_easy_setopt(curl, CURLOPT_HTTP_VERSION, CURL_HTTP_VERSION_2_PRIOR_KNOWLEDGE);
+  curl_easy_setopt(curl, CURLOPT_PIPEWAIT, 1L);
+  curl_easy_setopt(curl, CURLOPT_NOPROXY, "*");
+  curl_easy_setopt(curl, CURLOPT_TIMEOUT, 30L);
+  curl_easy_setopt(curl, CURLOPT_WRITEFUNCTION, discard_body);
+  return curl;
+}
+
+/* Runs every transfer added to multi, returns the number of failed ones */
+static int run_transfers(CURLM *multi)
+{
+  CURLMsg *msg;
+  int running = 1;
+  int queued;
+  int failed = 0;
+
+  while(running) {
+    if(curl_multi_perform(multi, &running) != CURLM_OK)
+      return 1;
+    if(running)
+      curl_multi_poll(multi, NULL, 0, 1000, NULL);
+  }
+  while((msg = curl_multi_info_read(multi, &queued))) {
+    long code = 0;
+    long version = 0;
+    if(msg->msg != CURLMSG_DONE)
+      continue;
+    curl_easy_getinfo(msg->easy_handle, CURLINFO_RESPONSE_CODE, &code);
+    curl_easy_getinfo(msg->easy_handle, CURLINFO_HTTP_VERSION, &version);
+    if(msg->data.result != CURLE_OK || code != 200 ||
+       version != CURL_HTTP_VERSION_2_0) {
+      fprintf(stderr, "HTTP/2 transfer failed: %s, status %ld, version %ld\n",
+              curl_easy_strerror(msg->data.result), code, version);
+      failed++;
+    }
+  }
+  return failed;
+}
+
+/* Fetches several URLs in parallel from a loopback HTTP/2 server: they must
+ * share a single multiplexed connection, which must then be reused from the
+ * connection cache by a follow-up request. */
+static int test_http2_server(void)
+{
+  CURLM *multi;
+  CURL *requests[PARALLEL_REQUESTS];
+  long new_connections = -1;
+  int port;
+  int i;
+  int ret = 0;
+
+  port = http2_server_start();
+  if(port < 0) {
+    fprintf(stderr, "could not start the HTTP/2 server\n");
+    return 1;
+  }
+
+  multi = curl_multi_init();
+  curl_multi_setopt(multi, CURLMOPT_PIPELINING, CURLPIPE_MULTIPLEX);
+  for(i = 0; i < PARALLEL_REQUESTS; i++) {
+    requests[i] = new_request(port, i);
+    curl_multi_add_handle(multi, requests[i]);
+  }
+  if(run_transfers(multi)) {
+    ret = 1;
+  }
+  else if(http2_server_connections() != 1) {
+    fprintf(stderr, "HTTP/2 requests were not multiplexed: %d connections\n",
+            http2_server_connections());
+    ret = 1;
+  }
+  else {
+    curl_multi_remove_handle(multi, requests[0]);
+    curl_multi_add_handle(multi, requests[0]);
+    ret = run_transfers(multi);
+    curl_easy_getinfo(requests[0], CURLINFO_NUM_CONNECTS, &new_connections);
+    if(!ret && (new_connections != 0 || http2_server_connections() != 1)) {
+      fprintf(stderr, "HTTP/2 connection was not reused from the cache\n");
+      ret = 1;
+    }
+  }
+  if(!ret)
+    printf("HTTP/2 multiplexing and connection reuse: OK\n");
+
+  for(i = 0; i < PARALLEL_REQUESTS; i++) {
+    curl_multi_remove_handle(multi, requests[i]);
+    curl_easy_cleanup(requests[i]);
+  }
+  curl_multi_cleanup(multi);
+  http2_server_stop();
+  return ret;
+}
+#endif
+
+/* Each argument names a feature that the package must provide */
+int main(int argc, char **argv)
 {
+  curl_version_info_data *info;
+  int i;
+  int ret = 0;
+
   printf("libcurl version %s\n", curl_version());
-  return 0;
+
+  curl_global_init(CURL_GLOBAL_DEFAULT);
+  info = curl_version_info(CURLVERSION_NOW);
+  for(i = 1; i < argc; i++) {
+    if(strcmp(argv[i], "http3") == 0) {
+      if(!(info->features & CURL_VERSION_HTTP3)) {
+        fprintf(stderr, "libcurl does not support HTTP/3\n");
+        ret = 1;
+      }
+      else {
+        printf("HTTP/3 support: nghttp3 %s, %s\n",
+               info->nghttp3_version ? info->nghttp3_version : "(unknown)",
+               info->quic_version ? info->quic_version : "(unknown)");
+      }
+    }
+    else if(strcmp(argv[i], "http2") == 0) {
+      if(!(info->features & CURL_VERSION_HTTP2)) {
+        fprintf(stderr, "libcurl does not support HTTP/2\n");
+        ret = 1;
+      }
+      else {
+        printf("HTTP/2 support: nghttp2 %s\n",
+               info->nghttp2_version ? info->nghttp2_version : "(unknown)");
+#ifdef TEST_HTTP2_SERVER
+        ret |= test_http2_server();
+#endif
+      }
+    }
+    else if(strcmp(argv[i], "asynchdns") == 0) {
+      if(!(info->features & CURL_VERSION_ASYNCHDNS)) {
+        fprintf(stderr, "libcurl does not support asynchronous DNS\n");
+        ret = 1;
+      }
+      else {
+        printf("Asynchronous DNS support: %s\n",
+               info->ares ? "c-ares" : "threaded resolver");
+      }
+    }
+    else if(strcmp(argv[i], "c-ares") == 0) {
+      if(!(info->features & CURL_VERSION_ASYNCHDNS) || !info->ares) {
+        fprintf(stderr, "libcurl does not use c-ares\n");
+        ret = 1;
+      }
+      else {
+        printf("c-ares version %s\n", info->ares);
+      }
+    }
+    else {
+      fprintf(stderr, "unknown feature: %s\n", argv[i]);
+      ret = 1;
+    }
+  }
+  curl_global_cleanup();
+  return ret;
 }
@@ -27,10 +27,18 @@ class LibVPXConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "realtime_only": [True, False],
+        "multi_res_encoding": [True, False],
+        "vp9_temporal_denoising": [True, False],
+        "vp9_highbitdepth": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "realtime_only": False,
+        "multi_res_encoding": False,
+        "vp9_temporal_denoising": False,
+        "vp9_highbitdepth": True,
     }
 
     _arch_options = ['mmx', 'sse', 'sse2', 'sse3', 'ssse3', 'sse4_1', 'avx', 'avx2', 'avx512']
@@ -138,9 +146,11 @@ class LibVPXConan(ConanFile):
             "--disable-unit-tests",
             "--disable-tools",
             "--disable-docs",
-            "--enable-vp9-highbitdepth",
             "--as=yasm",
         ])
+        for name in ["realtime_only", "multi_res_encoding", "vp9_temporal_denoising", "vp9_highbitdepth"]:
+            flag = name.replace("_", "-")
+            tc.configure_args.append(f"--enable-{flag}" if self.options.get_safe(name) else f"--disable-{flag}")
         # Note for MSVC: release libs are always built, we just avoid keeping the release lib
         # Note2: Can't use --enable-debug_libs (to help install on Windows),
         #     the makefile's install step fails as it wants to install a library that doesn't exist.
@@ -22,5 +22,10 @@ class TestPackageConan(ConanFile):
 
     def test(self):
         if can_run(self):
+            vpx_options = self.dependencies[self.tested_reference_str].options
+            flags = []
+            for name in ["realtime_only", "multi_res_encoding", "vp9_temporal_denoising", "vp9_highbitdepth"]:
+                flag = name.replace("_", "-")
+                flags.append(f"--enable-{flag}" if vpx_options.get_safe(name) else f"--disable-{flag}")
             bin_path = os.path.join(self.cpp.build.bindirs[0], "test_package")
-            self.run(bin_path, env="conanrun")
+            self.run(" ".join([bin_path] + flags), env="conanrun")
@@ -1,9 +1,31 @@
 #include <vpx/vpx_codec.h>
+#include <vpx/vpx_encoder.h>
+#include <vpx/vp8cx.h>
 
 #include <stdio.h>
+#include <string.h>
 
-int main()
+/* Each argument is a configure flag that the package must have been built with */
+int main(int argc, char **argv)
 {
+    const char *config = vpx_codec_build_config();
+    int highbitdepth = (vpx_codec_get_caps(vpx_codec_vp9_cx()) & VPX_CODEC_CAP_HIGHBITDEPTH) != 0;
+    int ret = 0;
+    int i;
+
     printf("vpx version %s\n", vpx_codec_version_str());
-    return 0;
+    printf("vpx build config: %s\n", config);
+
+    for (i = 1; i < argc; i++) {
+        if (!strstr(config, argv[i])) {
+            fprintf(stderr, "libvpx was not configured with %s\n", argv[i]);
+            ret = 1;
+        }
+        if ((strcmp(argv[i], "--enable-vp9-highbitdepth") == 0 && !highbitdepth) ||
+            (strcmp(argv[i], "--disable-vp9-highbitdepth") == 0 && highbitdepth)) {
+            fprintf(stderr, "VP9 encoder high bit depth capability does not match %s\n", argv[i]);
+            ret = 1;
+        }
+    }
+    return ret;
 }
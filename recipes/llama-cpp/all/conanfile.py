@@ -28,6 +28,11 @@ class LlamaCppConan(ConanFile):
         "with_examples": [True, False],
         "with_cuda": [True, False],
         "with_curl": [True, False],
+        "with_blas": [True, False],
+        "with_openmp": [True, False],
+        "cpu_isa": ["native", "generic", "avx", "avx2", "avx512", "amx"],
+        "backend_dl": [True, False],
+        "cpu_all_variants": [True, False],
     }
     default_options = {
         "shared": False,
@@ -35,10 +40,32 @@ class LlamaCppConan(ConanFile):
         "with_examples": False,
         "with_cuda": False,
         "with_curl": False,
+        "with_blas": False,
+        "with_openmp": True,
+        "cpu_isa": "native",
+        "backend_dl": False,
+        "cpu_all_variants": False,
+    }
+    options_description = {
+        "with_blas": "Use OpenBLAS for the matrix multiplications of prompt processing (ggml-blas backend)",
+        "with_openmp": "Use OpenMP for the thread pool of the CPU backend",
+        "cpu_isa": "Instruction set of the CPU backend: native uses the build machine's, the others are x86_64 levels",
+        "backend_dl": "Build the backends as modules loaded at runtime (GGML_BACKEND_DL), requires shared=True",
+        "cpu_all_variants": "Build one CPU backend module per instruction set and pick the best one at runtime, requires backend_dl=True",
     }
 
     implements = ["auto_shared_fpic"]
 
+    # Cumulative GGML_* CMake flags for each cpu_isa level
+    _cpu_isa_flags = {
+        "generic": [],
+        "avx": ["AVX"],
+        "avx2": ["AVX", "AVX2", "FMA", "F16C"],
+        "avx512": ["AVX", "AVX2", "FMA", "F16C", "AVX512"],
+        "amx": ["AVX", "AVX2", "FMA", "F16C", "AVX512", "AVX512_VBMI", "AVX512_VNNI", "AVX512_BF16",
+                "AMX_TILE", "AMX_INT8", "AMX_BF16"],
+    }
+
     @property
     def _is_new_llama(self):
         # Structure of llama.cpp libraries was changed after b4079
@@ -62,9 +89,34 @@ class LlamaCppConan(ConanFile):
     def export_sources(self):
         export_conandata_patches(self)
 
+    def config_options(self):
+        if not self._is_new_llama:
+            # The ggml backend registry (ggml-blas, GGML_BACKEND_DL, ...) was introduced after b4079
+            del self.options.with_blas
+            del self.options.backend_dl
+            del self.options.cpu_all_variants
+        elif is_apple_os(self):
+            # The blas backend is always built with the Accelerate framework
+            del self.options.with_blas
+
+    def configure(self):
+        if self.options.get_safe("cpu_all_variants"):
+            self.options.rm_safe("cpu_isa")
+
     def validate(self):
         check_min_cppstd(self, 17 if self._is_new_llama else 11)
 
+        cpu_isa = self.options.get_safe("cpu_isa")
+        if cpu_isa not in (None, "native", "generic") and self.settings.arch != "x86_64":
+            raise ConanInvalidConfiguration(f"{self.ref} cpu_isa={cpu_isa} is only available for x86_64")
+        if self.options.get_safe("backend_dl") and not self.options.shared:
+            raise ConanInvalidConfiguration(f"{self.ref} backend_dl=True requires shared=True")
+        if self.options.get_safe("cpu_all_variants"):
+            if not self.options.backend_dl:
+                raise ConanInvalidConfiguration(f"{self.ref} cpu_all_variants=True requires backend_dl=True")
+            if self.settings.arch != "x86_64":
+                raise ConanInvalidConfiguration(f"{self.ref} cpu_all_variants=True is only available for x86_64")
+
     def validate_build(self):
         if self._is_new_llama and self.settings.compiler == "msvc" and "arm" in self.settings.arch:
             raise ConanInvalidConfiguration("llama-cpp does not support ARM architecture on msvc, it recommends to use clang instead")
@@ -75,6 +127,8 @@ class LlamaCppConan(ConanFile):
     def requirements(self):
         if self.options.with_curl:
             self.requires("libcurl/[>=7.78 <9]")
+        if self.options.get_safe("with_blas"):
+            self.requires("openblas/[^0.3.27]")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -89,9 +143,23 @@ class LlamaCppConan(ConanFile):
         tc.variables["LLAMA_BUILD_TESTS"] = False
         tc.variables["LLAMA_BUILD_EXAMPLES"] = self.options.get_safe("with_examples")
         tc.variables["LLAMA_CURL"] = self.options.get_safe("with_curl")
-        if cross_building(self):
+        cpu_isa = self.options.get_safe("cpu_isa")
+        if cross_building(self) or cpu_isa != "native":
             tc.variables["LLAMA_NATIVE"] = False
             tc.variables["GGML_NATIVE_DEFAULT"] = False
+            tc.variables["GGML_NATIVE"] = False
+        for flag in self._cpu_isa_flags.get(str(cpu_isa), []):
+            tc.variables[f"GGML_{flag}"] = True
+        tc.variables["GGML_OPENMP"] = self.options.with_openmp
+        if self._is_new_llama:
+            tc.variables["GGML_BACKEND_DL"] = self.options.backend_dl
+            tc.variables["GGML_CPU_ALL_VARIANTS"] = self.options.cpu_all_variants
+        if self.options.get_safe("with_blas"):
+            tc.variables["GGML_BLAS"] = True
+            tc.variables["GGML_BLAS_VENDOR"] = "OpenBLAS"
+            # Otherwise ggml-blas looks for cblas.h with pkg-config
+            openblas_includedirs = self.dependencies["openblas"].cpp_info.aggregated_components().includedirs
+            tc.cache_variables["BLAS_INCLUDE_DIRS"] = ";".join(p.replace("\\", "/") for p in openblas_includedirs)
 
         tc.variables["GGML_BUILD_TESTS"] = False
         # Follow with_examples when newer versions can compile examples,
@@ -123,10 +191,15 @@ class LlamaCppConan(ConanFile):
             save(self, os.path.join(self.package_folder, "lib", "cmake", "llama-cpp-cuda-static.cmake"), self._cuda_build_module)
 
     def _get_backends(self):
+        if self.options.get_safe("backend_dl"):
+            # Backends are modules installed in bin/ and loaded with ggml_backend_load_all(), not linked
+            return []
         results = ["cpu"]
         if is_apple_os(self):
             results.append("blas")
             results.append("metal")
+        elif self.options.get_safe("with_blas"):
+            results.append("blas")
         if self.options.with_cuda:
             results.append("cuda")
         return results
@@ -153,7 +226,9 @@ class LlamaCppConan(ConanFile):
         if is_apple_os(self):
             self.cpp_info.components["common"].frameworks.extend(["Foundation", "Accelerate", "Metal"])
         elif self.settings.os in ("Linux", "FreeBSD"):
-            self.cpp_info.components["common"].system_libs.extend(["dl", "m", "pthread", "gomp"])
+            self.cpp_info.components["common"].system_libs.extend(["dl", "m", "pthread"])
+            if self.options.with_openmp:
+                self.cpp_info.components["common"].system_libs.append("gomp")
 
         if self.options.with_cuda and not self.options.shared:
             self.cpp_info.builddirs.append(os.path.join("lib", "cmake"))
@@ -190,3 +265,8 @@ class LlamaCppConan(ConanFile):
                     self.cpp_info.components["ggml-blas"].frameworks.append("Accelerate")
                 if "metal" in backends:
                     self.cpp_info.components["ggml-metal"].frameworks.extend(["Metal", "MetalKit", "Foundation", "CoreFoundation"])
+            elif "blas" in backends:
+                self.cpp_info.components["ggml-blas"].requires.append("openblas::openblas")
+            elif self.options.get_safe("with_blas"):
+                # The ggml-blas module loaded at runtime needs openblas
+                self.cpp_info.components["ggml"].requires.append("openblas::openblas")
@@ -1,5 +1,6 @@
 from conan import ConanFile
 from conan.errors import ConanInvalidConfiguration
+from conan.tools.build import stdcpp_library
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 from conan.tools.files import apply_conandata_patches, export_conandata_patches, get, copy, rm, rmdir, replace_in_file, collect_libs
 from conan.tools.microsoft import is_msvc, is_msvc_static_runtime, VCVars
@@ -29,6 +30,10 @@ class MimallocConan(ConanFile):
         "single_object": [True, False],
         "guarded": [True, False],
         "win_redirect": [True, False],
+        "opt_arch": [True, False],
+        "padding": [True, False],
+        "stat_level": [None, 0, 1, 2],
+        "use_cxx": [True, False],
     }
     default_options = {
         "shared": False,
@@ -39,6 +44,10 @@ class MimallocConan(ConanFile):
         "single_object": False,
         "guarded": False,
         "win_redirect": False,
+        "opt_arch": False,
+        "padding": True,
+        "stat_level": None,
+        "use_cxx": False,
     }
 
     def export_sources(self):
@@ -57,6 +66,10 @@ class MimallocConan(ConanFile):
             del self.options.inject
         if Version(self.version) < "2.1.9":
             del self.options.guarded
+        if Version(self.version) < "2.1.2":
+            del self.options.padding
+        if Version(self.version) < "2.2.0":
+            del self.options.opt_arch
 
     def configure(self):
         if self.options.shared:
@@ -128,6 +141,16 @@ class MimallocConan(ConanFile):
         tc.variables["MI_WIN_REDIRECT"] = "ON" if self.options.get_safe("win_redirect") else "OFF"
         tc.variables["MI_INSTALL_TOPLEVEL"] = "ON"
         tc.variables["MI_GUARDED"] = self.options.get_safe("guarded", False)
+        tc.variables["MI_USE_CXX"] = self.options.use_cxx
+        if "opt_arch" in self.options:
+            # armv8.1-a atomics on arm64, haswell (BMI/AVX2) on x86_64
+            tc.variables["MI_OPT_ARCH"] = self.options.opt_arch
+        if "padding" in self.options:
+            # Padding is forced in debug and secure builds unless explicitly disabled
+            tc.variables["MI_NO_PADDING"] = not self.options.padding
+        if self.options.stat_level.value is not None:
+            # 0 removes all statistics counters, upstream default is 2 in debug builds and 0 otherwise
+            tc.preprocessor_definitions["MI_STAT"] = str(self.options.stat_level)
         if Version(self.version) <= "1.7.6":
             tc.cache_variables["CMAKE_POLICY_VERSION_MINIMUM"] = "3.5" # CMake 4 support
         tc.generate()
@@ -229,3 +252,7 @@ class MimallocConan(ConanFile):
                 self.cpp_info.system_libs.extend(["psapi", "shell32", "user32", "bcrypt"])
             elif self.settings.os == "Linux":
                 self.cpp_info.system_libs.append("rt")
+            if self.options.use_cxx:
+                libcxx = stdcpp_library(self)
+                if libcxx:
+                    self.cpp_info.system_libs.append(libcxx)
@@ -1,12 +1,12 @@
 from conan import ConanFile
 from conan.tools.build import can_run
-from conan.tools.cmake import CMake, cmake_layout
+from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 import os
 
 
 class TestPackageConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
-    generators = "CMakeToolchain", "CMakeDeps", "VirtualRunEnv"
+    generators = "CMakeDeps", "VirtualRunEnv"
 
     def layout(self):
         cmake_layout(self)
@@ -14,6 +14,21 @@ class TestPackageConan(ConanFile):
     def requirements(self):
         self.requires(self.tested_reference_str)
 
+    def generate(self):
+        mimalloc = self.dependencies["mimalloc"]
+        mimalloc_options = mimalloc.options
+        tc = CMakeToolchain(self)
+        tc.cache_variables["MIMALLOC_USE_CXX"] = bool(mimalloc_options.use_cxx)
+        if "padding" in mimalloc_options:
+            # mimalloc only pads blocks in debug and secure builds
+            padded = mimalloc_options.padding and (mimalloc.settings.build_type == "Debug" or mimalloc_options.secure)
+            tc.cache_variables["MIMALLOC_PADDING"] = "1" if padded else "0"
+        else:
+            tc.cache_variables["MIMALLOC_PADDING"] = ""
+        stat_level = mimalloc_options.stat_level.value
+        tc.cache_variables["MIMALLOC_STAT_LEVEL"] = "" if stat_level is None else str(stat_level)
+        tc.generate()
+
     def build(self):
         cmake = CMake(self)
         cmake.configure()
@@ -2,10 +2,70 @@
 
 #include <stdlib.h>
 #include <stdio.h>
+#include <string.h>
+
+#if defined(TEST_MIMALLOC_USE_CXX)
+int test_mi_new_throws(void);
+#endif
+
+#if defined(TEST_MIMALLOC_STAT_LEVEL)
+struct stats_lines {
+    int normal;
+    int malloc_requested;
+};
+
+static void find_stats_lines(const char *msg, void *arg) {
+    struct stats_lines *lines = (struct stats_lines *)arg;
+    if (strstr(msg, "normal") != NULL) {
+        lines->normal = 1;
+    }
+    if (strstr(msg, "malloc req") != NULL) {
+        lines->malloc_requested = 1;
+    }
+}
+#endif
 
 int main() {
     void *data = mi_malloc(32);
+    int ret = EXIT_SUCCESS;
 
     printf("mimalloc version %d\n", mi_version());
-    return EXIT_SUCCESS;
+
+#if defined(TEST_MIMALLOC_USE_CXX)
+    if (!test_mi_new_throws()) {
+        printf("mimalloc built as C++: mi_new did not throw std::bad_alloc\n");
+        ret = EXIT_FAILURE;
+    }
+#endif
+
+#if defined(TEST_MIMALLOC_PADDING)
+    {
+        /* padding adds a few bytes after each block, which moves a 1024 bytes request to the next size class */
+        size_t good_size = mi_good_size(1024);
+        printf("mimalloc padding %s: good size %zu for 1024 bytes\n", TEST_MIMALLOC_PADDING ? "on" : "off", good_size);
+        if ((good_size > 1024) != TEST_MIMALLOC_PADDING) {
+            ret = EXIT_FAILURE;
+        }
+    }
+#endif
+
+#if defined(TEST_MIMALLOC_STAT_LEVEL)
+    {
+        /* the per size class counters are only printed at level 1, the requested bytes at level 2 */
+        struct stats_lines lines = {0, 0};
+        int i;
+        for (i = 0; i < 100; i++) {
+            mi_free(mi_malloc(16 * (size_t)(i + 1)));
+        }
+        mi_stats_print_out(find_stats_lines, &lines);
+        printf("mimalloc statistics level %d\n", TEST_MIMALLOC_STAT_LEVEL);
+        if (lines.normal != (TEST_MIMALLOC_STAT_LEVEL >= 1) ||
+            lines.malloc_requested != (TEST_MIMALLOC_STAT_LEVEL >= 2)) {
+            ret = EXIT_FAILURE;
+        }
+    }
+#endif
+
+    mi_free(data);
+    return ret;
 }
@@ -0,0 +1,18 @@
+#include "mimalloc.h"
+
+#include <cstddef>
+#include <cstdint>
+#include <new>
+
+// mi_new only throws std::bad_alloc when mimalloc itself is compiled as C++,
+// the C build of mimalloc aborts instead.
+extern "C" int test_mi_new_throws(void) {
+    mi_option_disable(mi_option_show_errors);
+    try {
+        void *data = mi_new(PTRDIFF_MAX);
+        mi_free(data);
+    } catch (const std::bad_alloc &) {
+        return 1;
+    }
+    return 0;
+}
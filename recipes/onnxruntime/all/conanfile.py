@@ -26,12 +26,16 @@ class OnnxRuntimeConan(ConanFile):
         "fPIC": [True, False],
         "with_xnnpack": [True, False],
         "with_cuda": [True, False],
+        "with_openvino": [True, False],
+        "enable_cpu_fp16_ops": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "with_xnnpack": False,
         "with_cuda": False,
+        "with_openvino": False,
+        "enable_cpu_fp16_ops": False,
     }
     short_paths = True
 
@@ -72,6 +76,8 @@ class OnnxRuntimeConan(ConanFile):
             self.requires("pthreadpool/cci.20231129")
         if self.options.with_cuda:
             self.requires("cutlass/3.5.0")
+        if self.options.with_openvino:
+            self.requires("openvino/2025.4.0")
         self.requires("cpuinfo/[>=cci.20250110]")
 
     def validate(self):
@@ -85,6 +91,12 @@ class OnnxRuntimeConan(ConanFile):
             # Commented here: https://github.com/onnx/onnx/pull/7505#issuecomment-3601468150
             raise ConanInvalidConfiguration("There are link errors using 'onnx/*:shared=True',"
                                             " use '-o onnx/*:shared=False' instead.")
+        if self.options.with_openvino:
+            # The OpenVINO EP is a provider module loaded through onnxruntime_providers_shared
+            if not self.options.shared:
+                raise ConanInvalidConfiguration(f"{self.ref} with_openvino=True requires shared=True")
+            if not self.dependencies["openvino"].options.enable_onnx_frontend:
+                raise ConanInvalidConfiguration(f"{self.ref} with_openvino=True requires -o openvino/*:enable_onnx_frontend=True")
 
     def validate_build(self):
         if self.settings.os == "Windows" and self.dependencies["abseil"].options.shared:
@@ -108,6 +120,7 @@ class OnnxRuntimeConan(ConanFile):
         tc.variables["onnxruntime_USE_XNNPACK"] = self.options.with_xnnpack
 
         tc.variables["onnxruntime_USE_CUDA"] = self.options.with_cuda
+        tc.variables["onnxruntime_USE_OPENVINO"] = self.options.with_openvino
         tc.variables["onnxruntime_BUILD_UNIT_TESTS"] = False
         tc.variables["onnxruntime_DISABLE_CONTRIB_OPS"] = False
         tc.variables["onnxruntime_USE_FLASH_ATTENTION"] = False
@@ -116,7 +129,7 @@ class OnnxRuntimeConan(ConanFile):
 
         tc.variables["onnxruntime_ARMNN_RELU_USE_CPU"] = False
         tc.variables["onnxruntime_ARMNN_BN_USE_CPU"] = False
-        tc.variables["onnxruntime_ENABLE_CPU_FP16_OPS"] = False
+        tc.variables["onnxruntime_ENABLE_CPU_FP16_OPS"] = self.options.enable_cpu_fp16_ops
         tc.variables["onnxruntime_ENABLE_EAGER_MODE"] = False
         tc.variables["onnxruntime_ENABLE_LAZY_TENSOR"] = False
 
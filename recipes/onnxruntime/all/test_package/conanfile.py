@@ -20,6 +20,7 @@ class TestPackageConan(ConanFile):
     def generate(self):
         tc = CMakeToolchain(self)
         tc.cache_variables["WITH_CUDA"] = self.dependencies["onnxruntime"].options.with_cuda
+        tc.cache_variables["WITH_OPENVINO"] = self.dependencies["onnxruntime"].options.with_openvino
         tc.generate()
         if self.settings.os == "Windows":
             # on windows the system dll C:\WINDOWS\system32\onnxruntime.dll may be loaded instead even if the conan lib is first in the PATH, see https://learn.microsoft.com/en-us/windows/win32/dlls/dynamic-link-library-search-order
@@ -1,6 +1,9 @@
 
 #include <onnxruntime_cxx_api.h>
+#include <algorithm>
 #include <iostream>
+#include <string>
+#include <unordered_map>
 
 #ifdef WITH_CUDA
 #include <onnxruntime_c_api.h>
@@ -10,7 +13,8 @@ int main() {
   const auto& api = Ort::GetApi();
   std::cout << "Version: " << OrtGetApiBase()->GetVersionString() << std::endl;
   std::cout << "Providers: " << std::endl;
-  for(const auto& provider: Ort::GetAvailableProviders())
+  const auto providers = Ort::GetAvailableProviders();
+  for(const auto& provider: providers)
     std::cout << provider << ", " << std::endl;
   
 #ifdef WITH_CUDA
@@ -18,6 +22,16 @@ int main() {
   OrtSessionOptionsAppendExecutionProvider_CUDA(session_options, 1);
   std::cout << "with cuda!" << std::endl;
 #endif
-  
+
+#ifdef WITH_OPENVINO
+  if (std::find(providers.begin(), providers.end(), std::string("OpenVINOExecutionProvider")) == providers.end()) {
+    std::cerr << "OpenVINOExecutionProvider is not available" << std::endl;
+    return 1;
+  }
+  Ort::SessionOptions openvino_session_options;
+  openvino_session_options.AppendExecutionProvider_OpenVINO_V2({{"device_type", "CPU"}});
+  std::cout << "with openvino!" << std::endl;
+#endif
+
   return 0;
 }
@@ -74,6 +74,9 @@ class OpenblasConan(ConanFile):
         "build_lapack": [True, False],
         "build_relapack": [True, False],
         "use_thread": [True, False],
+        "use_openmp": [True, False],
+        "num_threads": [None, "ANY"],
+        "buffer_size": [None, "ANY"],
         "use_locking": [True, False],
         "dynamic_arch": [True, False],
         "target": [None] + available_openblas_targets
@@ -84,6 +87,9 @@ class OpenblasConan(ConanFile):
         "build_lapack": True,
         "build_relapack": False,
         "use_thread": True,
+        "use_openmp": False,
+        "num_threads": None,
+        "buffer_size": None,
         "use_locking": True,
         "dynamic_arch": False,
         "target": None,
@@ -91,7 +97,10 @@ class OpenblasConan(ConanFile):
     options_description = {
         "build_lapack": "Build LAPACK and LAPACKE",
         "build_relapack": "Build with ReLAPACK (recursive implementation of several LAPACK functions on top of standard LAPACK)",
-        "use_thread": "Enable threads support",
+        "use_thread": "Enable threads support using OpenBLAS own pthreads pool",
+        "use_openmp": "Enable threads support using OpenMP instead of OpenBLAS own pthreads pool",
+        "num_threads": "Maximum number of threads, detected from the build machine if not set",
+        "buffer_size": "Per-thread memory buffer of 32 << buffer_size bytes, from 16 (2 MiB) to 25 (1 GiB), e.g. 20 for 32 MiB",
         "use_locking": "Use locks even in single-threaded builds to make them callable from multiple threads",
         "dynamic_arch": "Include support for multiple CPU targets, with automatic selection at runtime (x86/x86_64, aarch64 or ppc only)",
         "target": "OpenBLAS TARGET variable (see TargetList.txt)",
@@ -121,6 +130,10 @@ class OpenblasConan(ConanFile):
                 self.output.warning(f'Setting OpenBLAS TARGET={target} based on settings.arch. This may result in suboptimal performance. Set the "{self.name}/*:target=XXX" option to silence this warning.')
                 self.options.target = target
 
+    def requirements(self):
+        if self.options.use_openmp:
+            self.requires("openmp/system", transitive_libs=True)
+
     def build_requirements(self):
         if Version(self.version) >= "0.3.29":
             self.tool_requires("cmake/[>=3.16 <4]")
@@ -132,6 +145,15 @@ class OpenblasConan(ConanFile):
             if self.settings.compiler not in ["gcc", "clang"]:
                 # ld: unknown option: --allow-multiple-definition on apple-clang
                 raise ConanInvalidConfiguration(f'"{self.name}/*:build_relapack=True" option is only supported for GCC and Clang')
+        if self.options.use_openmp and self.options.use_thread:
+            raise ConanInvalidConfiguration(f'"{self.name}/*:use_openmp=True" and "{self.name}/*:use_thread=True" are mutually exclusive threading backends')
+        if self.options.num_threads and not str(self.options.num_threads).isdigit():
+            raise ConanInvalidConfiguration(f'"{self.name}/*:num_threads" must be a positive integer')
+        if self.options.buffer_size:
+            # OpenBLAS allocates 32 << BUFFERSIZE bytes, which must fit in an int
+            buffer_size = str(self.options.buffer_size)
+            if not buffer_size.isdigit() or not 16 <= int(buffer_size) <= 25:
+                raise ConanInvalidConfiguration(f'"{self.name}/*:buffer_size" must be between 16 (2 MiB) and 25 (1 GiB), e.g. 20 for 32 MiB')
 
     def validate_build(self):
         # If we're cross-compiling, and the user didn't provide the target, and
@@ -162,7 +184,13 @@ class OpenblasConan(ConanFile):
         tc.variables["BUILD_RELAPACK"] = self.options.build_relapack
 
         tc.variables["DYNAMIC_ARCH"] = self.options.dynamic_arch
-        tc.variables["USE_THREAD"] = self.options.use_thread
+        # USE_OPENMP builds the threaded library, using the OpenMP runtime instead of pthreads
+        tc.variables["USE_THREAD"] = self.options.use_thread or self.options.use_openmp
+        tc.variables["USE_OPENMP"] = self.options.use_openmp
+        if self.options.num_threads:
+            tc.cache_variables["NUM_THREADS"] = str(self.options.num_threads)
+        if self.options.buffer_size:
+            tc.cache_variables["BUFFERSIZE"] = str(self.options.buffer_size)
         tc.variables["USE_LOCKING"] = self.options.use_locking
 
         tc.variables["MSVC_STATIC_CRT"] = is_msvc_static_runtime(self)
@@ -203,16 +231,23 @@ class OpenblasConan(ConanFile):
         # CMake config file:
         # - OpenBLAS always has one and only one of these components: openmp, pthread or serial.
         # - Whatever if this component is requested or not, official CMake imported target is always OpenBLAS::OpenBLAS
-        # - TODO: add openmp component when implemented in this recipe
         self.cpp_info.set_property("cmake_file_name", "OpenBLAS")
         self.cpp_info.set_property("cmake_target_name", "OpenBLAS::OpenBLAS")
         self.cpp_info.set_property("pkg_config_name", "openblas")
         # 'pthread' causes issues without namespace
-        cmake_component_name = "pthread" if self.options.use_thread else "serial"  # TODO: how to model this in CMakeDeps?
+        # TODO: how to model this in CMakeDeps?
+        if self.options.use_openmp:
+            cmake_component_name = "openmp"
+        elif self.options.use_thread:
+            cmake_component_name = "pthread"
+        else:
+            cmake_component_name = "serial"
         self.cpp_info.components["openblas_component"].set_property("cmake_target_name", f"OpenBLAS::{cmake_component_name}")
         self.cpp_info.components["openblas_component"].set_property("pkg_config_name", "openblas")
         self.cpp_info.components["openblas_component"].includedirs.append(os.path.join("include", "openblas"))
         self.cpp_info.components["openblas_component"].libs = [self._lib_name]
+        if self.options.use_openmp:
+            self.cpp_info.components["openblas_component"].requires.append("openmp::openmp")
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["openblas_component"].system_libs.append("m")
             if self.options.use_thread:
@@ -21,7 +21,15 @@ class TestPackageConan(ConanFile):
         cmake.configure()
         cmake.build()
 
+    @property
+    def _expected_parallel(self):
+        # Values returned by openblas_get_parallel()
+        openblas_options = self.dependencies["openblas"].options
+        if openblas_options.get_safe("use_openmp"):
+            return 2
+        return 1 if openblas_options.use_thread else 0
+
     def test(self):
         if can_run(self):
             bin_path = os.path.join(self.cpp.build.bindir, "test_package")
-            self.run(bin_path, env="conanrun")
+            self.run(f"{bin_path} {self._expected_parallel}", env="conanrun")
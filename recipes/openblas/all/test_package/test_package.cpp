@@ -1,7 +1,8 @@
 #include <cblas.h>
 #include <stdio.h>
+#include <stdlib.h>
 
-int main()
+int main(int argc, char **argv)
 {
   int i=0;
   double A[6] = {1.0,2.0,1.0,-3.0,4.0,-1.0};
@@ -12,4 +13,11 @@ int main()
   for(i=0; i<9; i++)
     printf("%lf ", C[i]);
   printf("\n");
+
+  printf("OpenBLAS config: %s\n", openblas_get_config());
+  if (argc > 1 && openblas_get_parallel() != atoi(argv[1])) {
+    printf("Unexpected threading model %d, expected %s\n", openblas_get_parallel(), argv[1]);
+    return EXIT_FAILURE;
+  }
+  return EXIT_SUCCESS;
 }
@@ -107,6 +107,8 @@ class OpenCVConan(ConanFile):
         "parallel": [False, "tbb", "openmp"],
         "with_ipp": [False, "intel-ipp", "opencv-icv"],
         "with_eigen": [True, False],
+        "with_lapack": [True, False],
+        "with_carotene": [True, False],
         "with_opencl": [True, False],
         "with_cuda": [True, False],
         "with_cublas": [True, False],
@@ -166,6 +168,8 @@ class OpenCVConan(ConanFile):
         "parallel": False,
         "with_ipp": False,
         "with_eigen": True,
+        "with_lapack": False,
+        "with_carotene": False,
         "with_opencl": False,
         "with_cuda": False,
         "with_cublas": False,
@@ -278,6 +282,9 @@ class OpenCVConan(ConanFile):
         if self.settings.os != "Windows":
             del self.options.with_msmf
             del self.options.with_msmf_dxva
+        # Carotene is a NEON HAL (32-bit and 64-bit Arm)
+        if not str(self.settings.arch).startswith("arm"):
+            del self.options.with_carotene
 
         if self._has_with_ffmpeg_option:
             # Following the packager choice, ffmpeg is enabled by default when
@@ -347,6 +354,9 @@ class OpenCVConan(ConanFile):
         def eigen():
             return ["eigen::eigen"] if self.options.with_eigen else []
 
+        def lapack():
+            return ["openblas::openblas"] if self.options.with_lapack else []
+
         def ffmpeg():
             components = []
             if self.options.get_safe("with_ffmpeg"):
@@ -451,7 +461,7 @@ class OpenCVConan(ConanFile):
             "core": {
                 "is_built": True,
                 "no_option": True,
-                "requires": ["zlib::zlib"] + parallel() + eigen() + ipp(),
+                "requires": ["zlib::zlib"] + parallel() + eigen() + lapack() + ipp(),
                 "system_libs": [
                     (self.settings.os == "Android", ["dl", "m", "log"]),
                     (self.settings.os == "FreeBSD", ["m", "pthread"]),
@@ -1040,6 +1050,8 @@ class OpenCVConan(ConanFile):
             self.requires("eigen/3.4.0")
         if self.options.parallel == "tbb":
             self.requires("onetbb/2021.10.0")
+        if self.options.with_lapack:
+            self.requires("openblas/[^0.3.27]")
         if self.options.with_ipp == "intel-ipp":
             self.requires("intel-ipp/2020")
         # dnn module dependencies
@@ -1155,6 +1167,8 @@ class OpenCVConan(ConanFile):
         if self.options.with_ipp == "opencv-icv" and \
            not (self.settings.arch in ["x86", "x86_64"] and self.settings.os in ["Linux", "Macos", "Windows"]):
             raise ConanInvalidConfiguration(f"opencv-icv is not available for {self.settings.os}/{self.settings.arch}")
+        if self.options.with_lapack and not self.dependencies["openblas"].options.build_lapack:
+            raise ConanInvalidConfiguration(f"{self.ref} with_lapack requires LAPACKE from OpenBLAS. Use -o 'openblas/*:build_lapack=True'")
         if self.options.viz:
             raise ConanInvalidConfiguration(
                 "viz module can't be enabled yet. It requires VTK which is not available in conan-center."
@@ -1367,7 +1381,7 @@ class OpenCVConan(ConanFile):
         tc.variables["WITH_OPENNI"] = False
         tc.variables["WITH_OPENNI2"] = False
         tc.variables["WITH_OPENVX"] = False
-        tc.variables["WITH_CAROTENE"] = False
+        tc.variables["WITH_CAROTENE"] = self.options.get_safe("with_carotene", False)
         tc.variables["WITH_PLAIDML"] = False
         tc.variables["WITH_PVAPI"] = False
         tc.variables["WITH_QT"] = self.options.get_safe("with_qt", False)
@@ -1381,7 +1395,10 @@ class OpenCVConan(ConanFile):
             tc.variables["VULKAN_INCLUDE_DIRS"] = os.path.join(self.dependencies["vulkan-headers"].package_folder, "include").replace("\\", "/")
         tc.variables["WITH_XIMEA"] = False
         tc.variables["WITH_XINE"] = False
-        tc.variables["WITH_LAPACK"] = False
+        tc.variables["WITH_LAPACK"] = self.options.with_lapack
+        if self.options.with_lapack:
+            # Don't pick MKL from the system, OpenBLAS is found through OpenBLAS_HOME set by the openblas recipe
+            tc.variables["OPENCV_LAPACK_DISABLE_MKL"] = True
 
         tc.variables["WITH_GTK"] = self.options.get_safe("with_gtk", False)
         tc.variables["WITH_GTK_2_X"] = self._is_gtk_version2
@@ -2,5 +2,13 @@
 
 int main() {
     cv::Mat m = cv::Mat::zeros(400, 400, CV_8UC3);
+
+    // Goes through the LAPACK HAL when OpenCV is built with LAPACK
+    cv::Mat a = (cv::Mat_<double>(3, 3) << 4, 1, 0, 1, 3, 1, 0, 1, 2);
+    cv::Mat b = (cv::Mat_<double>(3, 1) << 1, 2, 3);
+    cv::Mat x;
+    if (!cv::solve(a, b, x, cv::DECOMP_SVD) || cv::norm(a * x - b) > 1e-9) {
+        return 1;
+    }
     return 0;
 }
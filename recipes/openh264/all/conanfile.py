@@ -1,7 +1,8 @@
 from conan import ConanFile
 from conan.tools.build import stdcpp_library
 from conan.tools.env import VirtualBuildEnv
-from conan.tools.files import copy, get, rmdir, rm, rename
+from conan.errors import ConanException
+from conan.tools.files import copy, get, load, rmdir, rm, rename, save
 from conan.tools.layout import basic_layout
 from conan.tools.microsoft import is_msvc
 from conan.tools.apple import fix_apple_shared_install_name
@@ -9,6 +10,7 @@ from conan.tools.scm import Version
 from conan.tools.meson import Meson, MesonToolchain
 
 import os
+import re
 
 
 required_conan_version = ">=2.0.9"
@@ -25,10 +27,12 @@ class OpenH264Conan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "with_asm": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "with_asm": True,
     }
     implements = ["auto_shared_fpic"]
 
@@ -36,6 +40,11 @@ class OpenH264Conan(ConanFile):
     def _is_clang_cl(self):
         return self.settings.os == 'Windows' and self.settings.compiler == 'clang'
 
+    @property
+    def _asm_definitions(self):
+        # Defined by openh264's meson.build to select the x86 (nasm) and ARM/AArch64 (NEON) kernels
+        return ["X86_ASM", "X86_32_ASM", "HAVE_AVX2", "HAVE_NEON", "HAVE_NEON_AARCH64", "HAVE_NEON_ARM64"]
+
     def layout(self):
         basic_layout(self, src_folder="src")
 
@@ -43,9 +52,9 @@ class OpenH264Conan(ConanFile):
         self.tool_requires("meson/[>=1.4.1 <2]")
         if not self.conf.get("tools.gnu:pkg_config", default=False, check_type=str):
             self.tool_requires("pkgconf/[>=2.2 <3]")
-        if self.settings.arch in ["x86", "x86_64"]:
+        if self.options.with_asm and self.settings.arch in ["x86", "x86_64"]:
             self.tool_requires("nasm/2.16.01")
-        if is_msvc(self) and self.settings.arch == "armv8":
+        if self.options.with_asm and is_msvc(self) and self.settings.arch == "armv8":
             self.tool_requires("strawberryperl/[*]")
             self.tool_requires("gas-preprocessor/[*]")
 
@@ -60,7 +69,32 @@ class OpenH264Conan(ConanFile):
         tc.project_options["tests"] = "disabled"
         tc.generate()
 
+    def _patch_sources(self):
+        if not self.options.with_asm:
+            # meson.build has no switch for the assembly kernels, and the sources are shared with
+            # with_asm=True builds, so strip them here: drop the macros selecting the kernels, and
+            # hide the CPU family from the nasm generator and the assembly source lists
+            meson_build = os.path.join(self.source_folder, "meson.build")
+            content = load(self, meson_build)
+            for definition in self._asm_definitions:
+                content = content.replace(f"'-D{definition}', ", "").replace(f"'-D{definition}'", "")
+            content = re.sub(r"^[ \t]*add_project_arguments\(\s*language\s*:[^)]*\)[ \t]*\n", "", content, flags=re.M)
+            asm_gen_block = re.search(r"^[ \t]*if\b.*\n(?=[ \t]*nasm\s*=\s*find_program\()", content, flags=re.M)
+            if not asm_gen_block:
+                raise ConanException(f"{self.ref} with_asm=False: nasm lookup not found in meson.build")
+            content = content[:asm_gen_block.start()] + "cpu_family = 'none'\n" + content[asm_gen_block.start():]
+            save(self, meson_build, content)
+            codec_folder = os.path.join(self.source_folder, "codec")
+            for root, _, files in os.walk(codec_folder):
+                if "meson.build" in files:
+                    subdir_meson_build = os.path.join(root, "meson.build")
+                    content = load(self, subdir_meson_build)
+                    # the unknown CPU family must now select no assembly sources instead of failing
+                    content = re.sub(r"\n[ \t]*else[ \t]*\n[ \t]*error\([^\n]*\)[ \t]*\n([ \t]*endif)", r"\n\1", content)
+                    save(self, subdir_meson_build, content)
+
     def build(self):
+        self._patch_sources()
         meson = Meson(self)
         meson.configure()
         meson.build()
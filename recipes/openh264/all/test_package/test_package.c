@@ -1,9 +1,102 @@
 #include <wels/codec_api.h>
 #include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#define WIDTH 320
+#define HEIGHT 240
+#define FRAMES 5
+#define SLICES 4
+#define THREADS 4
+
+/* Encodes a few frames with several slices spread over encoder threads */
+static int test_encoder(void)
+{
+    ISVCEncoder *encoder = NULL;
+    SEncParamExt param;
+    SSourcePicture picture;
+    SFrameBSInfo info;
+    unsigned char *frame;
+    int video_format = videoFormatI420;
+    int vcl_nals = 0;
+    int ret = 0;
+    int i, layer;
+
+    if (WelsCreateSVCEncoder(&encoder) != 0 || encoder == NULL) {
+        fprintf(stderr, "WelsCreateSVCEncoder failed\n");
+        return 1;
+    }
+
+    (*encoder)->GetDefaultParams(encoder, &param);
+    param.iUsageType = CAMERA_VIDEO_REAL_TIME;
+    param.iPicWidth = WIDTH;
+    param.iPicHeight = HEIGHT;
+    param.fMaxFrameRate = 30.0f;
+    param.iTargetBitrate = 1000000;
+    param.iRCMode = RC_BITRATE_MODE;
+    param.iSpatialLayerNum = 1;
+    param.iMultipleThreadIdc = THREADS;
+    param.sSpatialLayers[0].iVideoWidth = WIDTH;
+    param.sSpatialLayers[0].iVideoHeight = HEIGHT;
+    param.sSpatialLayers[0].fFrameRate = 30.0f;
+    param.sSpatialLayers[0].iSpatialBitrate = 1000000;
+    param.sSpatialLayers[0].sSliceArgument.uiSliceMode = SM_FIXEDSLCNUM_SLICE;
+    param.sSpatialLayers[0].sSliceArgument.uiSliceNum = SLICES;
+    if ((*encoder)->InitializeExt(encoder, &param) != cmResultSuccess) {
+        fprintf(stderr, "InitializeExt failed\n");
+        WelsDestroySVCEncoder(encoder);
+        return 1;
+    }
+    (*encoder)->SetOption(encoder, ENCODER_OPTION_DATAFORMAT, &video_format);
+
+    frame = (unsigned char *)malloc(WIDTH * HEIGHT * 3 / 2);
+    memset(&picture, 0, sizeof(picture));
+    picture.iPicWidth = WIDTH;
+    picture.iPicHeight = HEIGHT;
+    picture.iColorFormat = videoFormatI420;
+    picture.iStride[0] = WIDTH;
+    picture.iStride[1] = picture.iStride[2] = WIDTH / 2;
+    picture.pData[0] = frame;
+    picture.pData[1] = frame + WIDTH * HEIGHT;
+    picture.pData[2] = frame + WIDTH * HEIGHT * 5 / 4;
+
+    for (i = 0; i < FRAMES && !ret; i++) {
+        int p;
+        for (p = 0; p < WIDTH * HEIGHT * 3 / 2; p++) {
+            frame[p] = (unsigned char)(p * 7 + i * 13);
+        }
+        picture.uiTimeStamp = i * 33;
+        memset(&info, 0, sizeof(info));
+        if ((*encoder)->EncodeFrame(encoder, &picture, &info) != cmResultSuccess) {
+            fprintf(stderr, "EncodeFrame failed on frame %d\n", i);
+            ret = 1;
+        }
+        else if (i == 0) {
+            for (layer = 0; layer < info.iLayerNum; layer++) {
+                if (info.sLayerInfo[layer].uiLayerType == VIDEO_CODING_LAYER) {
+                    vcl_nals += info.sLayerInfo[layer].iNalCount;
+                }
+            }
+        }
+    }
+
+    if (!ret) {
+        printf("Encoded %d frames, first frame has %d slices\n", FRAMES, vcl_nals);
+        if (vcl_nals < 2) {
+            fprintf(stderr, "expected the first frame to be split in %d slices\n", SLICES);
+            ret = 1;
+        }
+    }
+
+    free(frame);
+    (*encoder)->Uninitialize(encoder);
+    WelsDestroySVCEncoder(encoder);
+    return ret;
+}
 
 int main()
 {
     OpenH264Version version = WelsGetCodecVersion();
     printf("OpenH264 version: %d.%d.%d\n", version.uMajor, version.uMinor, version.uRevision);
-    return 0;
+    return test_encoder();
 }
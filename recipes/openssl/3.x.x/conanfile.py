@@ -1,8 +1,8 @@
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.apple import fix_apple_shared_install_name, is_apple_os, XCRun
 from conan.tools.build import build_jobs
-from conan.tools.files import chdir, copy, get, replace_in_file, rm, rmdir, save
+from conan.tools.files import chdir, copy, get, load, replace_in_file, rm, rmdir, save
 from conan.tools.gnu import AutotoolsToolchain
 from conan.tools.layout import basic_layout
 from conan.tools.microsoft import is_msvc, msvc_runtime_flag, unix_path
@@ -10,6 +10,7 @@ from conan.tools.scm import Version
 
 import fnmatch
 import os
+import re
 import textwrap
 
 required_conan_version = ">=1.57.0"
@@ -31,6 +32,7 @@ class OpenSSLConan(ConanFile):
         "386": [True, False],
         "capieng_dialog": [True, False],
         "enable_capieng": [True, False],
+        "enable_ktls": [True, False],
         "enable_trace": [True, False],
         "no_aria": [True, False],
         "no_apps": [True, False],
@@ -115,6 +117,8 @@ class OpenSSLConan(ConanFile):
             self.options.rm_safe("enable_capieng")
         else:
             self.options.rm_safe("fPIC")
+        if self.settings.os != "Linux":
+            self.options.rm_safe("enable_ktls")
 
     def configure(self):
         if self.options.shared:
@@ -512,7 +516,25 @@ class OpenSSLConan(ConanFile):
             if self._use_nmake:
                 self._replace_runtime_in_file(os.path.join("Configurations", "10-main.conf"))
 
+            if self.options.get_safe("enable_ktls"):
+                # Configure only probes for linux/tls.h when the target name starts with "linux",
+                # which is never the case for the conan-* target generated by this recipe
+                replace_in_file(self, "Configure",
+                                "if ($target =~ m/^linux/) {",
+                                f'if ("{self._ancestor_target}" =~ m/^linux/) {{')
+
             self.run(f"{self._perl} ./Configure {args}", env="conanbuild")
+
+            if self.options.get_safe("enable_ktls"):
+                # configuration.h is only generated by make, but Configure records the
+                # disabled features in the %disabled table of configdata.pm
+                configdata = load(self, "configdata.pm")
+                disabled = re.search(r"our %disabled = \((.*?)\);", configdata, re.DOTALL)
+                if disabled is None or re.search(r'^\s*"ktls"\s*=>', disabled.group(1), re.MULTILINE):
+                    raise ConanException(
+                        "enable_ktls=True but kTLS was disabled by Configure: "
+                        "the kernel headers of the build environment do not provide linux/tls.h"
+                    )
             if self._use_nmake:
                 # When `--prefix=/`, the scripts derive `\` without escaping, which
                 # causes issues on Windows
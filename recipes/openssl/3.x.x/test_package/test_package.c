@@ -4,6 +4,40 @@
 void digest();
 int digest_legacy();
 
+#if defined(TEST_OPENSSL_KTLS)
+static int ktls()
+{
+#if defined(OPENSSL_NO_KTLS)
+	printf("OpenSSL was built without kTLS support\n");
+	return 1;
+#else
+	SSL_CTX *ctx;
+	BIO *bio;
+	int result = 0;
+
+	ctx = SSL_CTX_new(TLS_method());
+	if (ctx == NULL) {
+		printf("Error creating SSL_CTX\n");
+		return 1;
+	}
+	if ((SSL_CTX_set_options(ctx, SSL_OP_ENABLE_KTLS) & SSL_OP_ENABLE_KTLS) == 0) {
+		printf("Error enabling SSL_OP_ENABLE_KTLS\n");
+		result = 1;
+	}
+	/* No TLS session is established, so no kTLS send offload can be active yet */
+	bio = BIO_new(BIO_s_socket());
+	if (bio == NULL || BIO_get_ktls_send(bio) != 0) {
+		printf("Error querying BIO_get_ktls_send()\n");
+		result = 1;
+	}
+	printf("kTLS support: %s\n", result == 0 ? "yes" : "no");
+	BIO_free(bio);
+	SSL_CTX_free(ctx);
+	return result;
+#endif
+}
+#endif
+
 int main()
 {
 	int legacy_result = 0;
@@ -12,6 +46,13 @@ int main()
 	
 	digest();
 
+#if defined(TEST_OPENSSL_KTLS)
+	if (ktls() != 0) {
+		printf("Error testing kTLS support\n");
+		return 1;
+	}
+#endif
+
 #if defined(TEST_OPENSSL_LEGACY)
 	legacy_result = digest_legacy();
 	if (legacy_result != 0) {
@@ -32,6 +32,8 @@ class RocksDBConan(ConanFile):
         "with_tbb": [True, False],
         "with_folly": [True, False],
         "with_jemalloc": [True, False],
+        "with_liburing": [True, False],
+        "with_numa": [True, False],
         "enable_sse": [False, "sse42", "avx2"],
         "use_rtti": [True, False],
     }
@@ -46,6 +48,8 @@ class RocksDBConan(ConanFile):
         "with_tbb": False,
         "with_jemalloc": False,
         "with_folly": False,
+        "with_liburing": False,
+        "with_numa": False,
         "enable_sse": False,
         "use_rtti": False,
     }
@@ -58,6 +62,9 @@ class RocksDBConan(ConanFile):
             del self.options.fPIC
         if self.settings.arch != "x86_64":
             del self.options.with_tbb
+        if self.settings.os != "Linux":
+            del self.options.with_liburing
+            del self.options.with_numa
         if self.settings.build_type == "Debug":
             self.options.use_rtti = True  # Rtti are used in asserts for debug mode...
 
@@ -85,6 +92,10 @@ class RocksDBConan(ConanFile):
             self.requires("jemalloc/5.3.0")
         if self.options.with_folly:
             self.requires("folly/2024.08.12.00")
+        if self.options.get_safe("with_liburing"):
+            self.requires("liburing/2.11")
+        if self.options.get_safe("with_numa"):
+            self.requires("libnuma/2.0.19")
 
     def validate(self):
         check_min_cppstd(self, 17)
@@ -142,8 +153,9 @@ class RocksDBConan(ConanFile):
         elif self.options.enable_sse == "avx2":
             tc.variables["PORTABLE"] = False
             tc.variables["FORCE_SSE42"] = False
-        # not available yet in CCI
-        tc.variables["WITH_NUMA"] = False
+        # INFO: WITH_LIBURING is ON by default on Linux and would pick any liburing found in the system
+        tc.variables["WITH_LIBURING"] = self.options.get_safe("with_liburing", False)
+        tc.variables["WITH_NUMA"] = self.options.get_safe("with_numa", False)
         tc.generate()
 
         deps = CMakeDeps(self)
@@ -154,6 +166,15 @@ class RocksDBConan(ConanFile):
             deps.set_property("zstd", "cmake_target_name", "zstd::zstd")
         if self.options.with_folly:
             deps.set_property("folly", "cmake_additional_variables_prefixes", ["FOLLY",])
+        if self.options.get_safe("with_liburing"):
+            # https://github.com/facebook/rocksdb/blob/v10.5.1/cmake/modules/Finduring.cmake
+            deps.set_property("liburing", "cmake_file_name", "uring")
+            deps.set_property("liburing", "cmake_target_name", "uring::uring")
+        if self.options.get_safe("with_numa"):
+            # https://github.com/facebook/rocksdb/blob/v10.5.1/cmake/modules/FindNUMA.cmake
+            deps.set_property("libnuma", "cmake_file_name", "NUMA")
+            deps.set_property("libnuma", "cmake_target_name", "NUMA::NUMA")
+            deps.set_property("libnuma", "cmake_additional_variables_prefixes", ["NUMA",])
         deps.generate()
 
     def build(self):
@@ -205,4 +226,8 @@ class RocksDBConan(ConanFile):
         if self.options.with_jemalloc:
             self.cpp_info.components["librocksdb"].requires.append("jemalloc::jemalloc")
         if self.options.with_folly:
-            self.cpp_info.components["librocksdb"].requires.append("folly::folly")
\ No newline at end of file
+            self.cpp_info.components["librocksdb"].requires.append("folly::folly")
+        if self.options.get_safe("with_liburing"):
+            self.cpp_info.components["librocksdb"].requires.append("liburing::liburing")
+        if self.options.get_safe("with_numa"):
+            self.cpp_info.components["librocksdb"].requires.append("libnuma::libnuma")
@@ -45,6 +45,15 @@ class Sqlite3Conan(ConanFile):
         "max_column": [None, "ANY"],
         "max_variable_number": [None, "ANY"],
         "max_blob_size": [None, "ANY"],
+        "default_mmap_size": [None, "ANY"],
+        "max_mmap_size": [None, "ANY"],
+        "default_page_size": [None, "ANY"],
+        "default_cache_size": [None, "ANY"],
+        "default_wal_synchronous": [None, "off", "normal", "full", "extra"],
+        "default_worker_threads": [None, "ANY"],
+        "default_memstatus": [True, False],
+        "enable_stat4": [True, False],
+        "like_doesnt_match_blobs": [True, False],
         "build_executable": [True, False],
         "enable_default_vfs": [True, False],
         "enable_dbpage_vtab": [True, False],
@@ -77,6 +86,15 @@ class Sqlite3Conan(ConanFile):
         "max_column": None,             # Uses default value from source
         "max_variable_number": None,    # Uses default value from source
         "max_blob_size": None,          # Uses default value from source
+        "default_mmap_size": None,      # Uses default value from source
+        "max_mmap_size": None,          # Uses default value from source
+        "default_page_size": None,      # Uses default value from source
+        "default_cache_size": None,     # Uses default value from source
+        "default_wal_synchronous": None,  # Uses default value from source
+        "default_worker_threads": None,   # Uses default value from source
+        "default_memstatus": True,
+        "enable_stat4": False,
+        "like_doesnt_match_blobs": False,
         "build_executable": True,
         "enable_default_vfs": True,
         "enable_dbpage_vtab": False,
@@ -101,6 +119,12 @@ class Sqlite3Conan(ConanFile):
         if self.options.enable_icu:
             self.requires("icu/75.1")
 
+    def _integer_option(self, name):
+        try:
+            return int(str(self.options.get_safe(name)))
+        except ValueError:
+            raise ConanInvalidConfiguration(f"{name} must be an integer, got '{self.options.get_safe(name)}'")
+
     def validate(self):
         if self.options.build_executable:
             if not self.options.enable_default_vfs:
@@ -108,6 +132,16 @@ class Sqlite3Conan(ConanFile):
                 raise ConanInvalidConfiguration("build_executable=True cannot be combined with enable_default_vfs=False")
             if self.options.omit_load_extension:
                 raise ConanInvalidConfiguration("build_executable=True requires omit_load_extension=True")
+        if self.options.default_page_size:
+            page_size = self._integer_option("default_page_size")
+            if page_size < 512 or page_size > 65536 or page_size & (page_size - 1):
+                raise ConanInvalidConfiguration("default_page_size must be a power of two between 512 and 65536")
+        # SQLite silently lowers SQLITE_DEFAULT_MMAP_SIZE to SQLITE_MAX_MMAP_SIZE, whose default is 0x7fff0000
+        max_mmap_size = self._integer_option("max_mmap_size") if self.options.max_mmap_size else 0x7fff0000
+        if self.options.default_mmap_size and self._integer_option("default_mmap_size") > max_mmap_size:
+            raise ConanInvalidConfiguration(f"default_mmap_size must not be greater than max_mmap_size ({max_mmap_size})")
+        if self.options.default_worker_threads and self.options.threadsafe == 0:
+            raise ConanInvalidConfiguration("default_worker_threads requires threadsafe=1 or threadsafe=2")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -151,6 +185,21 @@ class Sqlite3Conan(ConanFile):
             tc.variables["MAX_VARIABLE_NUMBER"] = self.options.max_variable_number
         if self.options.max_blob_size:
             tc.variables["MAX_BLOB_SIZE"] = self.options.max_blob_size
+        if self.options.default_mmap_size:
+            tc.variables["DEFAULT_MMAP_SIZE"] = self.options.default_mmap_size
+        if self.options.max_mmap_size:
+            tc.variables["MAX_MMAP_SIZE"] = self.options.max_mmap_size
+        if self.options.default_page_size:
+            tc.variables["DEFAULT_PAGE_SIZE"] = self.options.default_page_size
+        if self.options.default_cache_size:
+            tc.variables["DEFAULT_CACHE_SIZE"] = self.options.default_cache_size
+        if self.options.default_wal_synchronous:
+            tc.variables["DEFAULT_WAL_SYNCHRONOUS"] = ["off", "normal", "full", "extra"].index(str(self.options.default_wal_synchronous))
+        if self.options.default_worker_threads:
+            tc.variables["DEFAULT_WORKER_THREADS"] = self.options.default_worker_threads
+        tc.variables["DISABLE_DEFAULT_MEMSTATUS"] = not self.options.default_memstatus
+        tc.variables["ENABLE_STAT4"] = self.options.enable_stat4
+        tc.variables["LIKE_DOESNT_MATCH_BLOBS"] = self.options.like_doesnt_match_blobs
         tc.variables["DISABLE_DEFAULT_VFS"] = not self.options.enable_default_vfs
         tc.variables["ENABLE_DBPAGE_VTAB"] = self.options.enable_dbpage_vtab
         tc.generate()
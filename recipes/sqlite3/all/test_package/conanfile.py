@@ -20,7 +20,29 @@ class TestPackageConan(ConanFile):
         cmake.configure()
         cmake.build()
 
+    @property
+    def _expected_compile_options(self):
+        sqlite_options = self.dependencies["sqlite3"].options
+        compile_options = []
+        for option, name in [("default_mmap_size", "DEFAULT_MMAP_SIZE"),
+                             ("max_mmap_size", "MAX_MMAP_SIZE"),
+                             ("default_page_size", "DEFAULT_PAGE_SIZE"),
+                             ("default_cache_size", "DEFAULT_CACHE_SIZE"),
+                             ("default_worker_threads", "DEFAULT_WORKER_THREADS")]:
+            if sqlite_options.get_safe(option):
+                compile_options.append(f"{name}={sqlite_options.get_safe(option)}")
+        if sqlite_options.get_safe("default_wal_synchronous"):
+            wal_synchronous = ["off", "normal", "full", "extra"].index(str(sqlite_options.default_wal_synchronous))
+            compile_options.append(f"DEFAULT_WAL_SYNCHRONOUS={wal_synchronous}")
+        if not sqlite_options.get_safe("default_memstatus", True):
+            compile_options.append("DEFAULT_MEMSTATUS=0")
+        if sqlite_options.get_safe("enable_stat4"):
+            compile_options.append("ENABLE_STAT4")
+        if sqlite_options.get_safe("like_doesnt_match_blobs"):
+            compile_options.append("LIKE_DOESNT_MATCH_BLOBS")
+        return compile_options
+
     def test(self):
         if can_run(self):
             bin_path = os.path.join(self.cpp.build.bindirs[0], "test_package")
-            self.run(bin_path, env="conanrun")
+            self.run(" ".join([bin_path] + self._expected_compile_options), env="conanrun")
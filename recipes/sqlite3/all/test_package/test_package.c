@@ -1,7 +1,17 @@
 #include <stdio.h>
 #include <sqlite3.h>
 
-int main() {
+int main(int argc, char **argv) {
+    int i;
+    int result = 0;
+
     printf("SQLite Version: %s\n", sqlite3_libversion());
-    return 0;
+
+    for (i = 1; i < argc; ++i) {
+        if (!sqlite3_compileoption_used(argv[i])) {
+            fprintf(stderr, "SQLite was not compiled with %s\n", argv[i]);
+            result = 1;
+        }
+    }
+    return result;
 }
@@ -1,5 +1,6 @@
 #include <stdio.h>
 #include <stdlib.h>
+#include <string.h>
 
 #ifdef ZLIB_COMPAT
 #  include "zlib.h"
@@ -9,7 +10,39 @@
 #  define GET_ZLIB_VERSION zlibng_version
 #endif
 
+#ifdef ZLIB_COMPAT
+/* zlib_compat=True is meant to be a drop-in replacement of zlib (see [replace_requires]),
+   so check a round-trip through the standard zlib API */
+static int roundtrip(void) {
+    unsigned char data[64 * 1024];
+    unsigned char decompressed[sizeof(data)];
+    uLongf compressed_size = compressBound(sizeof(data));
+    uLongf decompressed_size = sizeof(data);
+    unsigned char *compressed = malloc(compressed_size);
+    size_t i;
+    int ret = 1;
+
+    for (i = 0; i < sizeof(data); ++i) {
+        data[i] = (unsigned char)((i * 7) ^ (i >> 5));
+    }
+    if (compress2(compressed, &compressed_size, data, sizeof(data), Z_DEFAULT_COMPRESSION) == Z_OK &&
+        uncompress(decompressed, &decompressed_size, compressed, compressed_size) == Z_OK &&
+        decompressed_size == sizeof(data) && memcmp(data, decompressed, sizeof(data)) == 0) {
+        printf("compress2/uncompress: %lu -> %lu bytes\n", (unsigned long)sizeof(data), (unsigned long)compressed_size);
+        ret = 0;
+    }
+    free(compressed);
+    return ret;
+}
+#endif
+
 int main(void) {
     printf("ZLIB NG VERSION: %s\n", GET_ZLIB_VERSION());
+#ifdef ZLIB_COMPAT
+    if (roundtrip() != 0) {
+        printf("zlib round-trip failed\n");
+        return EXIT_FAILURE;
+    }
+#endif
     return EXIT_SUCCESS;
 }
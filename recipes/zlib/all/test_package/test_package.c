@@ -1,11 +1,101 @@
 #include <stdio.h>
 #include <stdlib.h>
+#include <string.h>
 
 #include <zlib.h>
 
+#define DATA_SIZE (256 * 1024)
+
+/* Round-trip data through the streaming and the one-shot zlib APIs, so that
+   zlib-compatible replacements (e.g. zlib-ng with zlib_compat=True through
+   [replace_requires]) are checked against the same contract */
+static int roundtrip_stream(const unsigned char *data, uLong size) {
+    uLong bound = compressBound(size);
+    unsigned char *compressed = malloc(bound);
+    unsigned char *decompressed = malloc(size);
+    z_stream strm;
+    int ret = 1;
+
+    memset(&strm, 0, sizeof(strm));
+    if (deflateInit(&strm, Z_BEST_SPEED) != Z_OK) {
+        goto done;
+    }
+    strm.next_in = (Bytef *)data;
+    strm.avail_in = (uInt)size;
+    strm.next_out = compressed;
+    strm.avail_out = (uInt)bound;
+    if (deflate(&strm, Z_FINISH) != Z_STREAM_END) {
+        deflateEnd(&strm);
+        goto done;
+    }
+    bound = strm.total_out;
+    deflateEnd(&strm);
+
+    memset(&strm, 0, sizeof(strm));
+    if (inflateInit(&strm) != Z_OK) {
+        goto done;
+    }
+    strm.next_in = compressed;
+    strm.avail_in = (uInt)bound;
+    strm.next_out = decompressed;
+    strm.avail_out = (uInt)size;
+    if (inflate(&strm, Z_FINISH) != Z_STREAM_END || strm.total_out != size) {
+        inflateEnd(&strm);
+        goto done;
+    }
+    inflateEnd(&strm);
+
+    ret = memcmp(data, decompressed, size) != 0;
+    printf("deflate/inflate: %lu -> %lu bytes\n", size, bound);
+
+done:
+    free(compressed);
+    free(decompressed);
+    return ret;
+}
+
+static int roundtrip_oneshot(const unsigned char *data, uLong size) {
+    uLongf compressed_size = compressBound(size);
+    uLongf decompressed_size = size;
+    unsigned char *compressed = malloc(compressed_size);
+    unsigned char *decompressed = malloc(size);
+    int ret = 1;
+
+    if (compress2(compressed, &compressed_size, data, size, Z_BEST_COMPRESSION) != Z_OK) {
+        goto done;
+    }
+    if (uncompress(decompressed, &decompressed_size, compressed, compressed_size) != Z_OK) {
+        goto done;
+    }
+    if (decompressed_size != size || crc32(0L, data, size) != crc32(0L, decompressed, size)) {
+        goto done;
+    }
+    ret = 0;
+    printf("compress2/uncompress: %lu -> %lu bytes\n", size, (uLong)compressed_size);
+
+done:
+    free(compressed);
+    free(decompressed);
+    return ret;
+}
+
 int main(void) {
+    unsigned char *data;
+    uLong i;
+    int ret;
 
     printf("ZLIB VERSION: %s\n", zlibVersion());
 
+    data = malloc(DATA_SIZE);
+    for (i = 0; i < DATA_SIZE; ++i) {
+        data[i] = (unsigned char)((i * 7) ^ (i >> 5));
+    }
+    ret = roundtrip_stream(data, DATA_SIZE) || roundtrip_oneshot(data, DATA_SIZE);
+    free(data);
+
+    if (ret != 0) {
+        printf("zlib round-trip failed\n");
+        return EXIT_FAILURE;
+    }
     return EXIT_SUCCESS;
 }
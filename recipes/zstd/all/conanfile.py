@@ -1,4 +1,5 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 from conan.tools.files import apply_conandata_patches, collect_libs, copy, export_conandata_patches, get, replace_in_file, rmdir, rm
 from conan.tools.scm import Version
@@ -22,12 +23,18 @@ class ZstdConan(ConanFile):
         "fPIC": [True, False],
         "threading": [True, False],
         "build_programs": [True, False],
+        "legacy_level": list(range(0, 8)),
+        "with_asm": [True, False],
+        "build_dictbuilder": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "threading": True,
         "build_programs": True,
+        "legacy_level": 5,
+        "with_asm": True,
+        "build_dictbuilder": True,
     }
 
     def export_sources(self):
@@ -36,6 +43,11 @@ class ZstdConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        # Huffman x86-64 assembly decoder is only available on x86_64 with GCC-compatible compilers
+        if Version(self.version) < "1.5.1" or self.settings.arch != "x86_64" or self.settings.compiler == "msvc":
+            del self.options.with_asm
+        if Version(self.version) < "1.5.6":
+            del self.options.build_dictbuilder
 
     def configure(self):
         if self.options.shared:
@@ -43,6 +55,10 @@ class ZstdConan(ConanFile):
         self.settings.rm_safe("compiler.cppstd")
         self.settings.rm_safe("compiler.libcxx")
 
+    def validate(self):
+        if not self.options.get_safe("build_dictbuilder", True) and self.options.build_programs:
+            raise ConanInvalidConfiguration(f"{self.ref} programs require the dictionary builder, set build_dictbuilder=True or build_programs=False")
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
@@ -55,6 +71,14 @@ class ZstdConan(ConanFile):
         tc.variables["ZSTD_BUILD_STATIC"] = not self.options.shared or self.options.build_programs
         tc.variables["ZSTD_BUILD_SHARED"] = self.options.shared
         tc.variables["ZSTD_MULTITHREAD_SUPPORT"] = self.options.threading
+        # Upstream declares these as cache entries, a plain variable may be ignored
+        tc.cache_variables["ZSTD_LEGACY_SUPPORT"] = self.options.legacy_level != 0
+        if self.options.legacy_level != 0:
+            tc.cache_variables["ZSTD_LEGACY_LEVEL"] = str(self.options.legacy_level)
+        if "build_dictbuilder" in self.options:
+            tc.cache_variables["ZSTD_BUILD_DICTBUILDER"] = bool(self.options.build_dictbuilder)
+        if not self.options.get_safe("with_asm", True):
+            tc.preprocessor_definitions["ZSTD_DISABLE_ASM"] = 1
         if Version(self.version) < "1.5.6":
             tc.cache_variables["CMAKE_POLICY_VERSION_MINIMUM"] = "3.5" # CMake 4 support
         tc.generate()
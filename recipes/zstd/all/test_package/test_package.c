@@ -2,11 +2,88 @@
 #include <stdlib.h>
 #include <string.h>
 #include <zstd.h>
+#ifdef TEST_ZSTD_DICTBUILDER
+#include <zdict.h>
+
+#define NB_SAMPLES 1000
+#define SAMPLE_CAPACITY 128
+#define DICT_CAPACITY 4096
+
+/* Trains a dictionary on small similar records, and round-trips a new record through it */
+static int test_dictbuilder(void) {
+    static char samples[NB_SAMPLES * SAMPLE_CAPACITY];
+    static size_t sample_sizes[NB_SAMPLES];
+    static char dict[DICT_CAPACITY];
+    char record[SAMPLE_CAPACITY];
+    char compressed[ZSTD_COMPRESSBOUND(SAMPLE_CAPACITY)];
+    char decompressed[SAMPLE_CAPACITY];
+    size_t samples_size = 0;
+    size_t dict_size, record_size, compressed_size, decompressed_size;
+    unsigned dict_id;
+    ZSTD_CCtx* cctx;
+    ZSTD_DCtx* dctx;
+    int i;
+
+    for (i = 0; i < NB_SAMPLES; i++) {
+        int n = snprintf(samples + samples_size, SAMPLE_CAPACITY,
+                         "{\"id\": %d, \"name\": \"user%d\", \"score\": %d, \"active\": %s}",
+                         i, i * 7 % 113, i * 31 % 997, i % 3 ? "true" : "false");
+        sample_sizes[i] = (size_t)n;
+        samples_size += (size_t)n;
+    }
+
+    dict_size = ZDICT_trainFromBuffer(dict, sizeof(dict), samples, sample_sizes, NB_SAMPLES);
+    if (ZDICT_isError(dict_size)) {
+        printf("dictionary training failed: %s\n", ZDICT_getErrorName(dict_size));
+        return 0;
+    }
+    dict_id = ZDICT_getDictID(dict, dict_size);
+
+    record_size = (size_t)snprintf(record, sizeof(record),
+                                   "{\"id\": %d, \"name\": \"user%d\", \"score\": %d, \"active\": %s}",
+                                   4242, 42, 512, "true");
+    cctx = ZSTD_createCCtx();
+    dctx = ZSTD_createDCtx();
+    compressed_size = ZSTD_compress_usingDict(cctx, compressed, sizeof(compressed), record, record_size,
+                                              dict, dict_size, 3);
+    decompressed_size = ZSTD_isError(compressed_size) ? compressed_size :
+        ZSTD_decompress_usingDict(dctx, decompressed, sizeof(decompressed), compressed, compressed_size,
+                                  dict, dict_size);
+    ZSTD_freeCCtx(cctx);
+    ZSTD_freeDCtx(dctx);
+
+    if (dict_id == 0 || ZSTD_isError(decompressed_size) ||
+        ZSTD_getDictID_fromFrame(compressed, compressed_size) != dict_id ||
+        decompressed_size != record_size || memcmp(record, decompressed, record_size) != 0) {
+        printf("round trip with the trained dictionary failed\n");
+        return 0;
+    }
+    printf("dictionary %u of %zu bytes: %zu bytes record compressed to %zu bytes\n",
+           dict_id, dict_size, record_size, compressed_size);
+    return 1;
+}
+#endif
 
 int main() {
     const char* originalData = "Sample text";
     size_t compressedSize = ZSTD_compressBound(strlen(originalData) + 1);
     printf("%zu\n", compressedSize);
 
+#ifdef TEST_ZSTD_THREADING
+    ZSTD_CCtx* cctx = ZSTD_createCCtx();
+    size_t ret = ZSTD_CCtx_setParameter(cctx, ZSTD_c_nbWorkers, 2);
+    ZSTD_freeCCtx(cctx);
+    if (ZSTD_isError(ret)) {
+        printf("multithreaded compression not supported: %s\n", ZSTD_getErrorName(ret));
+        return EXIT_FAILURE;
+    }
+#endif
+
+#ifdef TEST_ZSTD_DICTBUILDER
+    if (!test_dictbuilder()) {
+        return EXIT_FAILURE;
+    }
+#endif
+
     return 0;
 }